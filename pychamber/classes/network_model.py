@@ -1,37 +1,244 @@
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
+from skrf.frequency import Frequency
 from skrf.network import Network
 from skrf.networkSet import NetworkSet
 
+from pychamber.classes.logger import log
+
+# Positions come back from the positioner as floats, so angles are matched on
+# their value rounded to this many decimal places, whichever lookup is used
+_KEY_DECIMALS = 3
+# A number with an optional unit suffix, e.g. '2.4ghz' or '2400000000.0'
+_FREQ_RE = re.compile(r'\s*(\S+?)\s*([a-zA-Z]*hz)?\s*', re.IGNORECASE)
+
+
+def _angle_key(angle: Any) -> Any:
+    # The one matching rule for angles, for scalars and arrays alike
+    return np.round(angle, _KEY_DECIMALS)
+
+
+def _parse_freq(freq: str) -> float:
+    # Read a frequency string the way skrf's Frequency['2.4ghz'] does, but keep
+    # the value asked for rather than the nearest point. A bare number is in Hz,
+    # as the controller passes the spin box value straight through.
+    match = _FREQ_RE.fullmatch(freq)
+    if match is None:
+        raise ValueError(f"Can't read {freq!r} as a frequency")
+    value, unit = match.groups()
+    return Frequency.from_f([float(value)], unit=unit or 'hz').f[0]
+
+
+def _half_step(freqs: np.ndarray, idx: int) -> float:
+    # Half the spacing between point idx and its closest neighbour
+    gaps = np.diff(freqs[max(idx - 1, 0) : idx + 2])
+    return float(np.min(gaps)) / 2 if gaps.size else 0.0
+
+
+def _to_db(s: np.ndarray) -> np.ndarray:
+    # 20*log10(|s|), worked in place so the only allocation is the result.
+    # The offset keeps exact zeros finite.
+    out = np.abs(s)
+    out += np.finfo(out.dtype).tiny
+    np.log10(out, out=out)
+    out *= 20.0
+    return out
+
+
+def _index_rows(ntwks: List[Network]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    n = len(ntwks)
+    az = np.fromiter(
+        (ntwk.params['azimuth'] for ntwk in ntwks), dtype=np.float64, count=n
+    )
+    el = np.fromiter(
+        (ntwk.params['elevation'] for ntwk in ntwks), dtype=np.float64, count=n
+    )
+    # (networks, freqs, ports, ports). A VNA's dynamic range sits well inside
+    # single precision, and half the width is half the memory traffic per query
+    if n == 0:
+        s = np.empty((0, 0, 0, 0), dtype=np.complex64)
+    else:
+        s = np.array([ntwk.s for ntwk in ntwks], dtype=np.complex64)
+    return az, el, s
+
+
+class _Cut:
+    # One elevation cut, kept sorted by azimuth in buffers with spare rows at the
+    # end. A scan appends each cut in azimuth order, so an append is usually a
+    # write into the spare rows, and only a full buffer costs a copy (of this
+    # cut alone, doubling its size).
+    def __init__(self, az: np.ndarray, s: np.ndarray) -> None:
+        self.n = az.shape[0]
+        self._az = az.copy()
+        self._az_keys = _angle_key(self._az)
+        self._s = s.copy()
+        # Converting the stacked array takes one log10 pass, not one per network.
+        # Pin the layout and dtype so every query slices a C-contiguous float32
+        # block no matter how the rows were gathered
+        self._s_db = np.ascontiguousarray(_to_db(self._s), dtype=np.float32)
+        self._az_rad: Optional[np.ndarray] = None
+
+    @property
+    def az(self) -> np.ndarray:
+        return self._az[: self.n]
+
+    @property
+    def s_db(self) -> np.ndarray:
+        return self._s_db[: self.n]
+
+    @property
+    def az_rad(self) -> np.ndarray:
+        # The polar plot redraws in radians on every point and frequency change,
+        # so convert once per change to the cut rather than once per redraw
+        if self._az_rad is None:
+            self._az_rad = np.deg2rad(self.az)
+        return self._az_rad
+
+    def find(self, azimuth: float) -> Optional[int]:
+        key = _angle_key(float(azimuth))
+        i = int(np.searchsorted(self._az_keys[: self.n], key))
+        if i == self.n or self._az_keys[i] != key:
+            return None
+        return i
+
+    def insert(self, az: float, s: np.ndarray) -> int:
+        i = int(np.searchsorted(self.az, az, side='right'))
+        if self.n == self._az.shape[0]:
+            self._grow()
+        n = self.n
+        rows = zip(
+            (self._az, self._az_keys, self._s, self._s_db),
+            (az, _angle_key(az), s, _to_db(s)),
+        )
+        for buf, row in rows:
+            # Shifts only the rows after i in this cut, which is none of them
+            # when the scan runs in azimuth order
+            buf[i + 1 : n + 1] = buf[i:n]
+            buf[i] = row
+        self.n += 1
+        self._az_rad = None
+        return i
+
+    def _grow(self) -> None:
+        size = 2 * self._az.shape[0]
+        for name in ('_az', '_az_keys', '_s', '_s_db'):
+            old = getattr(self, name)
+            new = np.empty((size, *old.shape[1:]), dtype=old.dtype)
+            new[: self.n] = old[: self.n]
+            setattr(self, name, new)
+
 
 class NetworkModel(NetworkSet):
+    ntwk_set: List[Network]
+
+    def __init__(self, ntwk_set: Optional[List[Network]] = None, name=None) -> None:
+        super().__init__(ntwk_set, name)
+        self._build_index()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Models saved before the index existed (or in an older layout) still load
+        self.__dict__.update(state)
+        if '_cuts' not in state:
+            self._build_index()
+
+    def _build_index(self) -> None:
+        # The networks are indexed by elevation cut, each cut holding its
+        # azimuths and S-parameters as arrays, so lookups are binary searches and
+        # slices rather than a Python walk over every network's params. The
+        # Networks themselves are kept for export and the Python console.
+        az, el, s = _index_rows(self.ntwk_set)
+        # The Networks are ordered by (elevation, azimuth), the order the cuts
+        # are laid end to end in, so cut j is self.ntwk_set[self._el_rows(...)]
+        keys = _angle_key(el)
+        order = np.lexsort((az, keys))
+        az, el, s, keys = az[order], el[order], s[order], keys[order]
+        self.ntwk_set = [self.ntwk_set[i] for i in order]
+        # Cut j spans rows _el_start[j]:_el_start[j + 1]
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        self._el_start = np.r_[0, bounds, len(keys)] if len(keys) else np.array([0])
+        self._el_cuts = keys[self._el_start[:-1]]
+        self._cuts = [
+            _Cut(az[a:b], s[a:b]) for a, b in zip(self._el_start[:-1], self._el_start[1:])
+        ]
+        # Hold the Frequency itself too, so parsing and validation don't go back
+        # through the first Network each time
+        self._frequency = self.ntwk_set[0].frequency if self.ntwk_set else None
+        self._freqs = self._frequency.f if self._frequency is not None else np.array([])
+        self._freq_index = {str(f): i for i, f in enumerate(self._freqs)}
+        for prop in ('azimuths', 'elevations'):
+            self.__dict__.pop(prop, None)
+
+    def _find_cut(self, elevation: float) -> Tuple[int, bool]:
+        # Where the cut at this elevation is, or would go, and whether it exists
+        key = _angle_key(float(elevation))
+        j = int(np.searchsorted(self._el_cuts, key))
+        return j, j < len(self._cuts) and self._el_cuts[j] == key
+
+    def _cut(self, elevation: float) -> Optional[_Cut]:
+        j, found = self._find_cut(elevation)
+        return self._cuts[j] if found else None
+
+    def _el_rows(self, elevation: float) -> Optional[slice]:
+        j, found = self._find_cut(elevation)
+        if not found:
+            return None
+        return slice(int(self._el_start[j]), int(self._el_start[j + 1]))
+
+    def _resolve_freq(self, freq: str) -> int:
+        try:
+            return self._freq_index[freq]
+        except KeyError:
+            # Not one of our points verbatim (e.g. '2.4ghz'), so parse it and
+            # snap to the nearest point, remembering the answer. Anything
+            # further out than half a step is off the axis altogether.
+            f = _parse_freq(freq)
+            idx = int(np.argmin(np.abs(self._freqs - f)))
+            if not np.isclose(self._freqs[idx], f):
+                if abs(self._freqs[idx] - f) > _half_step(self._freqs, idx):
+                    raise ValueError(f"{freq} is outside the measured frequency range")
+                log.warning(f"No data at {freq}, using the nearest point instead")
+            self._freq_index[freq] = idx
+            return idx
+
     @property
     def freqs(self) -> np.ndarray:
-        if len(self) == 0:
-            return np.array([])
-        else:
-            return self[0].frequency.f  # type: ignore
+        return self._freqs
 
-    @property
+    @functools.cached_property
     def azimuths(self) -> np.ndarray:
         if len(self) == 0:
             return np.array([])
         else:
-            return np.array(
-                [n.params['azimuth'] for n in self.sel({'elevation': 0})]  # type: ignore
-            ).reshape(-1, 1)
+            vals = np.unique(np.concatenate([cut.az for cut in self._cuts]))
+            return vals.reshape(vals.size, 1)
 
-    @property
+    @functools.cached_property
     def elevations(self) -> np.ndarray:
         if len(self) == 0:
             return np.array([])
         else:
-            return np.array(
-                [n.params['elevation'] for n in self.sel({'azimuth': 0})]  # type: ignore
-            ).reshape(-1, 1)
+            # The cut keys, so points a hair apart count as one elevation
+            return self._el_cuts.reshape(-1, 1)
+
+    def cut_azimuths(self, elevation: float) -> np.ndarray:
+        # The azimuths of one elevation cut, from the same rows and in the same
+        # order as mags(freq, elevation=elevation), so the two pair up point for
+        # point even when other cuts hold different azimuths
+        cut = self._cut(elevation)
+        if cut is None:
+            return np.array([])
+        return cut.az.reshape(-1, 1)
+
+    def cut_azimuths_rad(self, elevation: float) -> np.ndarray:
+        cut = self._cut(elevation)
+        if cut is None:
+            return np.array([])
+        return cut.az_rad.reshape(-1, 1)
 
     def mags(
         self,
@@ -41,17 +248,78 @@ class NetworkModel(NetworkSet):
     ) -> np.ndarray:
         if len(self) == 0:
             return np.array([])
+        elif elevation is not None:
+            cut = self._cut(elevation)
+            if cut is None:
+                return np.array([])
+            if azimuth is not None:
+                # A single point, so a binary search along its cut
+                i = cut.find(azimuth)
+                if i is None:
+                    return np.array([])
+                if freq:
+                    return cut.s_db[i, self._resolve_freq(freq)].reshape(-1, 1)
+                else:
+                    return cut.s_db[i].reshape(-1, 1)
+            # A whole elevation cut is a contiguous block of rows, so this is a
+            # strided view rather than a gathered copy
+            if freq:
+                return cut.s_db[:, self._resolve_freq(freq)].reshape(-1, 1)
+            else:
+                return cut.s_db[0].reshape(-1, 1)
         else:
-            params = dict()
-            if azimuth:
-                params['azimuth'] = azimuth
-            if elevation:
-                params['elevation'] = elevation
+            # Every cut, or the one row per cut at this azimuth, in row order
+            if azimuth is None:
+                hits = [(cut, slice(None)) for cut in self._cuts]
+            else:
+                found = ((cut, cut.find(azimuth)) for cut in self._cuts)
+                hits = [(cut, slice(i, i + 1)) for cut, i in found if i is not None]
+            if not hits:
+                return np.array([])
 
             if freq:
-                return np.array([n[freq].s_db for n in self.sel(params)])  # type: ignore
+                fi = self._resolve_freq(freq)
+                mags = np.concatenate([cut.s_db[rows, fi] for cut, rows in hits])
+                return mags.reshape(-1, 1)
             else:
-                return self.sel(params)[0].s_db.reshape(-1, 1)  # type: ignore
+                cut, rows = hits[0]
+                return cut.s_db[rows][0].reshape(-1, 1)
 
     def append(self, ntwk: Network) -> NetworkModel:
-        return NetworkModel(list(self) + [ntwk])  # type: ignore
+        return NetworkModel([*self.ntwk_set, ntwk])
+
+    def append_inplace(self, ntwk: Network) -> None:
+        # Grows this model by one network without rebuilding the whole set and
+        # its index, which matters when appending once per scan point
+        if len(self) == 0:
+            self.ntwk_set.append(ntwk)
+            self.dims = ntwk.params.keys()
+            self.coords = {p: [ntwk.params[p]] for p in self.dims}
+            self._build_index()
+            return
+
+        if ntwk.number_of_ports != self.ntwk_set[0].number_of_ports:
+            raise ValueError("All networks in a model must have the same # of ports")
+        if ntwk.frequency != self._frequency:
+            raise ValueError("All networks in a model must share a frequency axis")
+
+        for p in self.dims:
+            if ntwk.params[p] not in self.coords[p]:
+                self.coords[p].append(ntwk.params[p])
+
+        # Insert at its (elevation, azimuth) position to keep the rows sorted.
+        # Only this cut's buffers and the per-cut offsets change.
+        az, el, s = _index_rows([ntwk])
+        j, found = self._find_cut(el[0])
+        if found:
+            i = self._cuts[j].insert(az[0], s[0])
+        else:
+            # The first point at this elevation opens a new cut
+            self._cuts.insert(j, _Cut(az, s))
+            self._el_cuts = np.insert(self._el_cuts, j, _angle_key(el[0]))
+            self._el_start = np.insert(self._el_start, j, self._el_start[j])
+            i = 0
+            self.__dict__.pop('elevations', None)
+        self.ntwk_set.insert(int(self._el_start[j]) + i, ntwk)
+        self._el_start[j + 1 :] += 1
+        self.__dict__.pop('azimuths', None)
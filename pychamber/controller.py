@@ -5,7 +5,7 @@ from typing import Dict, Optional, Union
 
 import cloudpickle as pickle
 import numpy as np
-from PyQt5.QtCore import QMutex, QThread
+from PyQt5.QtCore import QMutex, QThread, QTimer
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
 from pyvisa.errors import LibraryError, VisaIOError
 from serial.tools import list_ports
@@ -29,6 +29,28 @@ from pychamber.ui.settings_dialog import SettingsDialog
 
 MUTEX = QMutex()
 
+# Extent edits closer together than this are written to the settings once
+_EXTENT_DEBOUNCE_MS = 30
+
+# Slack for float steps like 0.1 that don't divide the span exactly
+_EXTENT_EPS = 1e-9
+
+
+def _extent_angles(
+    start: float, stop: float, step: float, include_stop: bool = True
+) -> np.ndarray:
+    # The point count is worked out once and the angles written in a single
+    # vectorized pass. np.arange(start, stop + step, step) can gain or lose the
+    # last point to rounding in the float step.
+    if step <= 0:
+        return np.array([start])
+    span = (stop - start) / step
+    if include_stop:
+        n = int(np.floor(span + _EXTENT_EPS)) + 1
+    else:
+        n = int(np.ceil(span - _EXTENT_EPS))
+    return start + step * np.arange(max(n, 0))
+
 
 class AzJogDir(Enum):
     LEFT = -1
@@ -120,24 +142,27 @@ class PyChamberCtrl:
         self.view.polarPlotFreqSpinBox.valueChanged.connect(self.update_polar_plot)
         self.view.overFreqPlotAzSpinBox.valueChanged.connect(self.update_over_freq_plot)
         self.view.overFreqPlotElSpinBox.valueChanged.connect(self.update_over_freq_plot)
-        self.view.positionerAzExtentStartSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('az-start', val)
-        )
-        self.view.positionerAzExtentStopSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('az-stop', val)
-        )
-        self.view.positionerAzExtentStepSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('az-step', val)
+        # Each axis writes its start/stop/step back as one batch once the edits
+        # stop, not one settings write per spin box value
+        az_boxes = (
+            self.view.positionerAzExtentStartSpinBox,
+            self.view.positionerAzExtentStopSpinBox,
+            self.view.positionerAzExtentStepSpinBox,
         )
-        self.view.positionerElExtentStartSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('el-start', val)
-        )
-        self.view.positionerElExtentStopSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('el-stop', val)
-        )
-        self.view.positionerElExtentStepSpinBox.valueChanged.connect(
-            lambda val: self.settings.setval('el-step', val)
+        el_boxes = (
+            self.view.positionerElExtentStartSpinBox,
+            self.view.positionerElExtentStopSpinBox,
+            self.view.positionerElExtentStepSpinBox,
         )
+        self._extent_timers: Dict[str, QTimer] = {}
+        for axis, boxes in (('az', az_boxes), ('el', el_boxes)):
+            timer = QTimer(self.view)
+            timer.setSingleShot(True)
+            timer.setInterval(_EXTENT_DEBOUNCE_MS)
+            timer.timeout.connect(functools.partial(self.save_extent, axis))
+            for box in boxes:
+                box.valueChanged.connect(lambda _, t=timer: t.start())
+            self._extent_timers[axis] = timer
 
         # Combo Boxes
         self.view.polarPlotPolarizationComboBox.currentIndexChanged.connect(
@@ -176,11 +201,19 @@ class PyChamberCtrl:
 
         resp = warning.exec_()
         if resp == QMessageBox.Yes:
+            for axis, timer in self._extent_timers.items():
+                if timer.isActive():
+                    self.save_extent(axis)
             del self.settings
             event.accept()
         else:
             event.ignore()
 
+    def save_extent(self, axis: str) -> None:
+        self._extent_timers[axis].stop()
+        for end in ('start', 'stop', 'step'):
+            self.settings[f'{axis}-{end}'] = getattr(self.view, f'{axis}_extent_{end}')
+
     def update_positioner_ports(self) -> None:
         self.view.positionerPortComboBox.clear()
         ports = [p.device for p in list_ports.comports()]
@@ -317,11 +350,17 @@ class PyChamberCtrl:
         self.view.experimentCutProgressBar.show()
         self.view.update_polar_plot_freqs()
 
-        azimuths = np.arange(
-            self.view.az_extent_start, self.view.az_extent_stop, self.view.az_extent_step
+        azimuths = _extent_angles(
+            self.view.az_extent_start,
+            self.view.az_extent_stop,
+            self.view.az_extent_step,
+            include_stop=False,
         )
-        elevations = np.arange(
-            self.view.el_extent_start, self.view.el_extent_stop, self.view.el_extent_step
+        elevations = _extent_angles(
+            self.view.el_extent_start,
+            self.view.el_extent_stop,
+            self.view.el_extent_step,
+            include_stop=False,
         )
 
         try:
@@ -337,10 +376,8 @@ class PyChamberCtrl:
 
         self.view.update_polar_plot_freqs()
 
-        azimuths = np.arange(
-            self.view.az_extent_start,
-            self.view.az_extent_stop + self.view.az_extent_step,
-            self.view.az_extent_step,
+        azimuths = _extent_angles(
+            self.view.az_extent_start, self.view.az_extent_stop, self.view.az_extent_step
         )
 
         try:
@@ -357,10 +394,8 @@ class PyChamberCtrl:
 
         self.view.update_polar_plot_freqs()
 
-        elevations = np.arange(
-            self.view.el_extent_start,
-            self.view.el_extent_stop + self.view.el_extent_step,
-            self.view.el_extent_step,
+        elevations = _extent_angles(
+            self.view.el_extent_start, self.view.el_extent_stop, self.view.el_extent_step
         )
 
         try:
@@ -409,7 +444,6 @@ class PyChamberCtrl:
         self.view.analyzerPol2ComboBox.addItems(ports)
         log.info("Connected")
         self.view.enable_freq()
-        self.view.enable_experiment()
 
     def connect_to_positioner(self) -> None:
         if self.positioner:
@@ -432,7 +466,6 @@ class PyChamberCtrl:
         self.view.el_pos = self.positioner.elevation_deg
         log.info("Connected")
         self.view.enable_jog()
-        self.view.enable_experiment()
 
     def set_freq(self, setting: FreqSetting) -> None:
         if not self.analyzer:
@@ -495,8 +528,12 @@ class PyChamberCtrl:
         if len(self.ntwk_models[pol]) == 0:
             return
 
-        azimuths = np.deg2rad(self.ntwk_models[pol].azimuths.reshape(-1, 1))
-        mags = self.ntwk_models[pol].mags(freq, elevation=0).reshape(-1, 1)
+        azimuths = self.ntwk_models[pol].cut_azimuths_rad(0)
+        try:
+            mags = self.ntwk_models[pol].mags(freq, elevation=0)
+        except ValueError as e:
+            log.error(str(e))
+            return
 
         self.view.update_polar_plot(azimuths, mags)
 
@@ -516,7 +553,7 @@ class PyChamberCtrl:
             return
 
         freqs = self.ntwk_models[pol].freqs.reshape(-1, 1)
-        mags = self.ntwk_models[pol].mags(azimuth=az, elevation=el).reshape(-1, 1)
+        mags = self.ntwk_models[pol].mags(azimuth=az, elevation=el)
 
         self.view.update_over_freq_plot(freqs, mags)
 
@@ -587,7 +624,7 @@ class PyChamberCtrl:
             label = pol1.label if pol1.label != "" else "Polarization 1"
             if self.cal is not None:
                 data = data - self.cal['data'][label]
-            self.ntwk_models[label] = self.ntwk_models[label].append(data)
+            self.ntwk_models[label].append_inplace(data)
 
             self.update_polar_plot()
             self.update_over_freq_plot()
@@ -597,7 +634,7 @@ class PyChamberCtrl:
             label = pol2.label if pol2.label != "" else "Polarization 2"
             if self.cal is not None:
                 data = data - self.cal['data'][label]
-            self.ntwk_models[label] = self.ntwk_models[label].append(data)
+            self.ntwk_models[label].append_inplace(data)
 
             self.update_polar_plot()
             self.update_over_freq_plot()
@@ -654,8 +691,8 @@ class PyChamberCtrl:
         self.worker.timeUpdate.connect(lambda t: setattr(self.view, 'time_remaining', t))
         self.worker.azMoveComplete.connect(lambda p: setattr(self.view, 'az_pos', p))
         self.worker.elMoveComplete.connect(lambda p: setattr(self.view, 'el_pos', p))
-        self.worker.pol1Acquired.connect(lambda data: self.update_pol1_ntwk_model(data))
-        self.worker.pol2Acquired.connect(lambda data: self.update_pol2_ntwk_model(data))
+        self.worker.pol1Acquired.connect(self.update_pol1_ntwk_model)
+        self.worker.pol2Acquired.connect(self.update_pol2_ntwk_model)
 
         self.thread.start()
 
@@ -2,7 +2,7 @@ from PyQt5.QtGui import QPixmap
 from PyQt5.QtWidgets import QDialog, QLabel, QVBoxLayout
 
 import pychamber
-from pychamber.ui import resources_rc
+from pychamber.ui import resources_rc  # noqa: F401 (registers Qt resources)
 
 
 class AboutPyChamber(QDialog):
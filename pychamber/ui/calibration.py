@@ -1,11 +1,9 @@
 import itertools
-import logging
 import pathlib
 import tempfile
 from typing import Dict, List, Optional, Tuple
 
 import cloudpickle as pickle
-import numpy as np
 import pandas as pd
 from pandas.errors import ParserError
 from PyQt5.QtCore import Qt
@@ -29,11 +27,10 @@ from PyQt5.QtWidgets import (
     QWizardPage,
 )
 from quantiphy import Quantity
-from skrf import Frequency, Network
+from skrf import Network
 from skrf.vi import vna
 
 from pychamber.classes.logger import log
-from pychamber.ui.mplwidget import MplRectWidget
 from pychamber.ui.pop_ups import MsgLevel, PopUpMessage
 
 _FONTS = {'header': QFont('Roboto', 12, QFont.Bold)}
@@ -138,6 +135,8 @@ class CalibrationPage(QWizardPage):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
+        # Combo box text -> port pair, e.g. 'S21' -> (2, 1)
+        self._pol_map: Dict[str, Tuple[int, int]] = {}
         self.setLayout(QVBoxLayout())
 
         hlayout = QHBoxLayout()
@@ -165,6 +164,10 @@ class CalibrationPage(QWizardPage):
         hlayout.addWidget(self.pol2ComboBox)
         self.layout().addLayout(hlayout)
 
+        # Imported here so matplotlib loads with the first calibration plot
+        # rather than with the application
+        from pychamber.ui.mplwidget import MplRectWidget
+
         hlayout = QHBoxLayout()
         self.plot = MplRectWidget('tab:blue', self)
         hlayout.addWidget(self.plot)
@@ -178,14 +181,19 @@ class CalibrationPage(QWizardPage):
         self.layout().addLayout(hlayout)
 
     @property
-    def pol_1(self) -> Optional[List[int]]:
-        pol = self.pol1ComboBox.currentText()
-        return [int(pol[1]), int(pol[2])] if pol != "" else None
+    def pol_1(self) -> Optional[Tuple[int, int]]:
+        return self._pol_map.get(self.pol1ComboBox.currentText())
 
     @property
-    def pol_2(self) -> Optional[List[int]]:
-        pol = self.pol2ComboBox.currentText()
-        return [int(pol[1]), int(pol[2])] if pol != "" else None
+    def pol_2(self) -> Optional[Tuple[int, int]]:
+        return self._pol_map.get(self.pol2ComboBox.currentText())
+
+    def _set_pol_items(self, items: List[str]) -> None:
+        # Parse each parameter once here rather than on every pol_1/pol_2 read
+        self._pol_map = {pol: (int(pol[1]), int(pol[2])) for pol in items}
+        for combo in (self.pol1ComboBox, self.pol2ComboBox):
+            combo.clear()
+            combo.addItems([""] + items)
 
     def initializePage(self) -> None:
         self.setTitle("Calibration")
@@ -202,10 +210,7 @@ class CalibrationPage(QWizardPage):
         if self.wizard().analyzer:
             ports = self.wizard().analyzer.ports
             ports = [f"S{''.join(p)}" for p in itertools.permutations(ports, 2)]
-            self.pol1ComboBox.clear()
-            self.pol2ComboBox.clear()
-            self.pol1ComboBox.addItems([""] + ports)
-            self.pol2ComboBox.addItems([""] + ports)
+            self._set_pol_items(ports)
 
         self.saveButton.setEnabled(False)
 
@@ -385,6 +390,8 @@ class CalibrationViewDialog(QDialog):
         self.notes_text_edit = QPlainTextEdit(self)
         self.notes_text_edit.setPlainText(self.notes)
         self.notes_tab.layout().addWidget(self.notes_text_edit)
+        from pychamber.ui.mplwidget import MplRectWidget
+
         self.plot = MplRectWidget('tab:blue', self)
         self.plot_tab.layout().addWidget(self.plot)
         self.table = QTableView(self)
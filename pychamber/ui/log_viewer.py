@@ -1,6 +1,4 @@
-import pathlib
 import shutil
-import tempfile
 
 from classes.logger import log_path
 from PyQt5.QtWidgets import QDialog, QFileDialog, QPlainTextEdit, QPushButton, QVBoxLayout
@@ -1,11 +1,25 @@
-import time
+from __future__ import annotations
+
+import contextlib
+import functools
 import webbrowser
-from typing import List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import numpy as np
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QObject, QSignalBlocker, QSize, Qt, QTimer
 from PyQt5.QtGui import QDoubleValidator, QFont, QIcon, QIntValidator, QPixmap
 from PyQt5.QtWidgets import (
+    QBoxLayout,
     QComboBox,
     QDesktopWidget,
     QDoubleSpinBox,
@@ -29,31 +43,148 @@ from quantiphy import Quantity
 from pychamber import utils
 from pychamber.classes.polarization import Polarization
 from pychamber.classes.settings_manager import SettingsManager
-from pychamber.ui import resources_rc
+from pychamber.ui import resources_rc  # noqa: F401 (registers Qt resources)
 
 from .freq_spin_box import FrequencySpinBox
-from .mplwidget import MplPolarWidget, MplRectWidget
+
+if TYPE_CHECKING:
+    # Imported where the plots are built, so matplotlib loads with the first plot
+    from .mplwidget import MplPolarWidget, MplRectWidget
 
 _SIZE_POLICIES = {
-    'min_min': QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Minimum),
-    'min_pref': QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred),
-    'min_exp': QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Expanding),
-    'min_fix': QSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed),
-    'pref_min': QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum),
-    'pref_pref': QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred),
-    'exp_min': QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum),
-    'exp_pref': QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum),
+    'min_min': (QSizePolicy.Minimum, QSizePolicy.Minimum),
+    'min_pref': (QSizePolicy.Minimum, QSizePolicy.Preferred),
+    'min_exp': (QSizePolicy.Minimum, QSizePolicy.Expanding),
+    'min_fix': (QSizePolicy.Minimum, QSizePolicy.Fixed),
+    'pref_min': (QSizePolicy.Preferred, QSizePolicy.Minimum),
+    'pref_pref': (QSizePolicy.Preferred, QSizePolicy.Preferred),
+    'exp_min': (QSizePolicy.Expanding, QSizePolicy.Minimum),
+    'exp_pref': (QSizePolicy.Expanding, QSizePolicy.Preferred),
 }
 
 _FONTS = {
-    'bold_12': QFont('Roboto', 12, QFont.Bold),
-    'bold_14': QFont('Roboto', 14, QFont.Bold),
-    'bold_20': QFont('Roboto', 20, QFont.Bold),
-    'bold_20_ibm': QFont('IBM 3270', 20, QFont.Bold),
+    'bold_12': ('Roboto', 12, QFont.Bold),
+    'bold_14': ('Roboto', 14, QFont.Bold),
+    'bold_20': ('Roboto', 20, QFont.Bold),
+    'bold_20_ibm': ('IBM 3270', 20, QFont.Bold),
 }
 
+_ICON_SIZE = QSize(32, 32)
+
+# Scale spin box edits closer together than this collapse into one redraw
+_SCALE_DEBOUNCE_MS = 50
+
+
+# The Qt objects are only built once something asks for them, and then shared
+@functools.lru_cache(maxsize=None)
+def _size_policy_for(h: QSizePolicy.Policy, v: QSizePolicy.Policy) -> QSizePolicy:
+    return QSizePolicy(h, v)
+
+
+def _size_policy(name: str) -> QSizePolicy:
+    return _size_policy_for(*_SIZE_POLICIES[name])
+
+
+@functools.lru_cache(maxsize=None)
+def _font(name: str) -> QFont:
+    return QFont(*_FONTS[name])
+
+
+@functools.lru_cache(maxsize=None)
+def _icon(path: str) -> QIcon:
+    return QIcon(QPixmap(path))
+
+
+def _add_widgets(layout: QBoxLayout, *items: Union[QWidget, QSpacerItem]) -> None:
+    for item in items:
+        if isinstance(item, QSpacerItem):
+            layout.addItem(item)
+        else:
+            layout.addWidget(item)
+
+
+def _debounced(parent: QObject, slot: Callable[[], None]) -> QTimer:
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(_SCALE_DEBOUNCE_MS)
+    timer.timeout.connect(slot)
+    return timer
+
+
+def _config_spin(
+    box: QSpinBox,
+    minimum: int,
+    maximum: int,
+    step: int,
+    value: int,
+    accelerated: bool = False,
+) -> None:
+    _config_tracking(box, accelerated)
+    box.setRange(minimum, maximum)
+    box.setSingleStep(step)
+    box.setValue(value)
+
+
+def _config_double_spin(
+    box: QDoubleSpinBox,
+    minimum: float,
+    maximum: float,
+    step: float,
+    value: float,
+    decimals: int,
+    accelerated: bool = False,
+) -> None:
+    _config_tracking(box, accelerated)
+    box.setRange(minimum, maximum)
+    box.setSingleStep(step)
+    box.setDecimals(decimals)
+    box.setValue(value)
+
+
+def _config_tracking(box: Union[QSpinBox, QDoubleSpinBox], accelerated: bool) -> None:
+    # Without keyboard tracking, typing "200" emits one valueChanged on commit
+    # rather than one each for "2", "20" and "200"
+    box.setKeyboardTracking(False)
+    box.setAccelerated(accelerated)
+
+
+@contextlib.contextmanager
+def _signals_blocked(*objs: QObject) -> Iterator[None]:
+    with contextlib.ExitStack() as stack:
+        for obj in objs:
+            stack.enter_context(QSignalBlocker(obj))
+        yield
+
+
+def _labeled_hbox(
+    parent: QWidget, text: str, widget: QWidget
+) -> Tuple[QLabel, QHBoxLayout]:
+    label = QLabel(text, parent)
+    hlayout = QHBoxLayout()
+    hlayout.addWidget(label)
+    hlayout.addWidget(widget)
+    return label, hlayout
+
+
+# (attribute, text, icon, row, column) for one jog button
+_JogButton = Tuple[str, str, Optional[str], int, int]
+
 
 class MainWindow(QMainWindow):
+    # The jog buttons for each axis
+    _AZ_JOG_BUTTONS: Tuple[_JogButton, ...] = (
+        ('jogAzLeftButton', "", ":/icons/icons/LeftArrow.png", 1, 0),
+        ('jogAzZeroButton', "0", None, 1, 1),
+        ('jogAzRightButton', "", ":/icons/icons/RightArrow.png", 1, 2),
+        ('jogAzSubmitButton', "", ":/icons/icons/Check.png", 1, 5),
+    )
+    _EL_JOG_BUTTONS: Tuple[_JogButton, ...] = (
+        ('jogElUpButton', "", ":/icons/icons/UpArrow.png", 3, 0),
+        ('jogElZeroButton', "0", None, 3, 1),
+        ('jogElDownButton', "", ":/icons/icons/DownArrow.png", 3, 2),
+        ('jogElSubmitButton', "", ":/icons/icons/Check.png", 3, 5),
+    )
+
     def __init__(self, *args) -> None:
         super().__init__(*args)
         self.centralwidget = QWidget(self)
@@ -65,6 +196,18 @@ class MainWindow(QMainWindow):
         self.mainWindowLayout.addLayout(self.rightSideLayout, stretch=3)
         self.centralwidget.setLayout(self.mainWindowLayout)
 
+        self._freq_cache: Dict[int, Tuple[str, Optional[Quantity]]] = {}
+        # Whether the analyzer / positioner halves of the UI are live
+        self._freq_ok = False
+        self._jog_ok = False
+        # Last positions written to the readouts, kept as numbers so reading
+        # them back doesn't mean parsing the line edits
+        self._az_pos = 0.0
+        self._el_pos = 0.0
+        # Built the first time their tab is shown, see _lazy_init_tab
+        self._polarPlot: Optional[MplPolarWidget] = None
+        self._overFreqPlot: Optional[MplRectWidget] = None
+
         self.setupUi()
 
         self.setWindowTitle("PyChamber")
@@ -73,6 +216,10 @@ class MainWindow(QMainWindow):
         self.show()
         self.center()
 
+        # Fill in the visible plot once the event loop is running, so the
+        # window comes up without waiting on matplotlib
+        QTimer.singleShot(0, lambda: self._lazy_init_tab(self.tabWidget.currentIndex()))
+
     def setupUi(self) -> None:
         self.setupMenuBar()
         self.setupAnalyzerGroupBox()
@@ -85,13 +232,29 @@ class MainWindow(QMainWindow):
         self.updateFonts()
         self.updateValidators()
         self.initInputs()
-        self.initPlots()
 
         self.leftSideLayout.addStretch()
 
-        # Convenience methods
-        self.update_polar_plot = self.polarPlot.update_plot
-        self.update_over_freq_plot = self.overFreqPlot.update_plot
+    @property
+    def polarPlot(self) -> MplPolarWidget:
+        if self._polarPlot is None:
+            self._lazy_init_tab(self.tabWidget.indexOf(self.polarPlotTab))
+        assert self._polarPlot is not None
+        return self._polarPlot
+
+    def update_polar_plot(self, xdata: np.ndarray, ydata: np.ndarray) -> None:
+        self.polarPlot.update_plot(xdata, ydata)
+
+    @property
+    def overFreqPlot(self) -> MplRectWidget:
+        # Built the first time its tab is shown, or sooner if something needs it
+        if self._overFreqPlot is None:
+            self._lazy_init_tab(self.tabWidget.indexOf(self.overFreqPlotTab))
+        assert self._overFreqPlot is not None
+        return self._overFreqPlot
+
+    def update_over_freq_plot(self, xdata: np.ndarray, ydata: np.ndarray) -> None:
+        self.overFreqPlot.update_plot(xdata, ydata)
 
     def center(self):
         qr = self.frameGeometry()
@@ -121,10 +284,7 @@ class MainWindow(QMainWindow):
 
     @property
     def analyzer_start_freq(self) -> Optional[Quantity]:
-        if (f := self.analyzerStartFreqLineEdit.text()) != "":
-            return utils.to_freq(f)
-        else:
-            return None
+        return self._parse_freq(self.analyzerStartFreqLineEdit)
 
     @analyzer_start_freq.setter
     def analyzer_start_freq(self, freq: float) -> None:
@@ -133,10 +293,7 @@ class MainWindow(QMainWindow):
 
     @property
     def analyzer_stop_freq(self) -> Optional[Quantity]:
-        if (f := self.analyzerStopFreqLineEdit.text()) != "":
-            return utils.to_freq(f)
-        else:
-            return None
+        return self._parse_freq(self.analyzerStopFreqLineEdit)
 
     @analyzer_stop_freq.setter
     def analyzer_stop_freq(self, freq: float) -> None:
@@ -145,16 +302,24 @@ class MainWindow(QMainWindow):
 
     @property
     def analyzer_freq_step(self) -> Optional[Quantity]:
-        if (f := self.analyzerStepFreqLineEdit.text()) != "":
-            return utils.to_freq(f)
-        else:
-            return None
+        return self._parse_freq(self.analyzerStepFreqLineEdit)
 
     @analyzer_freq_step.setter
     def analyzer_freq_step(self, freq: float) -> None:
         f = Quantity(freq, units='Hz')
         self.analyzerStepFreqLineEdit.setText(f.render())
 
+    def _parse_freq(self, line_edit: QLineEdit) -> Optional[Quantity]:
+        # Quantity parsing isn't cheap, so keep the last result per line edit and
+        # only parse again once its text has changed
+        text = line_edit.text()
+        cached = self._freq_cache.get(id(line_edit))
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        freq = utils.to_freq(text) if text != "" else None
+        self._freq_cache[id(line_edit)] = (text, freq)
+        return freq
+
     @property
     def analyzer_n_points(self) -> Optional[int]:
         if (n := self.analyzerNPointsLineEdit.text()) != "":
@@ -230,18 +395,20 @@ class MainWindow(QMainWindow):
 
     @property
     def az_pos(self) -> float:
-        return float(self.azPositionLineEdit.text())
+        return self._az_pos
 
     @az_pos.setter
     def az_pos(self, pos: Union[float, str]) -> None:
+        self._az_pos = float(pos)
         self.azPositionLineEdit.setText(str(pos))
 
     @property
     def el_pos(self) -> float:
-        return float(self.elPositionLineEdit.text())
+        return self._el_pos
 
     @el_pos.setter
     def el_pos(self, pos: Union[float, str]) -> None:
+        self._el_pos = float(pos)
         self.elPositionLineEdit.setText(str(pos))
 
     @property
@@ -250,19 +417,24 @@ class MainWindow(QMainWindow):
 
     @total_progress.setter
     def total_progress(self, val: int) -> None:
-        self.experimentTotalProgressBar.setValue(val)
-        if val == 100:
-            self.experimentTotalProgressBar.setFormat("Done!")
-        else:
-            self.experimentTotalProgressBar.setFormat("%p%")
+        # Progress is reported far more often than the percentage moves, so
+        # skip repaints for repeats and only swap the format going to/from 100
+        bar = self.experimentTotalProgressBar
+        old = bar.value()
+        if val == old:
+            return
+        bar.setValue(val)
+        if (val == 100) != (old == 100):
+            bar.setFormat("Done!" if val == 100 else "%p%")
 
     @property
     def cut_progress(self) -> int:
-        return self.experimentTotalProgressBar.value()
+        return self.experimentCutProgressBar.value()
 
     @cut_progress.setter
     def cut_progress(self, val: int) -> None:
-        self.experimentCutProgressBar.setValue(val)
+        if val != self.experimentCutProgressBar.value():
+            self.experimentCutProgressBar.setValue(val)
 
     @property
     def time_remaining(self) -> str:
@@ -270,11 +442,15 @@ class MainWindow(QMainWindow):
 
     @time_remaining.setter
     def time_remaining(self, time_: float) -> None:
-        if np.isclose(time_, 0):
+        # Called on every scan point, so plain integer math rather than strftime
+        if time_ < 0.5:
             self.experimentTimeRemainingLineEdit.setText("")
-        else:
-            time_str = time.strftime("%H hours %M minutes %S seconds", time.gmtime(time_))
-            self.experimentTimeRemainingLineEdit.setText(time_str)
+            return
+        h, rem = divmod(int(time_), 3600)
+        m, s = divmod(rem, 60)
+        self.experimentTimeRemainingLineEdit.setText(
+            f"{h:02d} hours {m:02d} minutes {s:02d} seconds"
+        )
 
     @property
     def polar_plot_pol(self) -> str:
@@ -346,72 +522,78 @@ class MainWindow(QMainWindow):
 
     def enable_jog(self) -> None:
         self.jogGroupBox.setEnabled(True)
+        self._jog_ok = True
+        self._maybe_enable_experiment()
 
     def disable_jog(self) -> None:
         self.jogGroupBox.setEnabled(False)
+        self._jog_ok = False
+        self._maybe_enable_experiment()
 
     def enable_jog_buttons(self) -> None:
-        self.jogAzLeftButton.setEnabled(True)
-        self.jogAzZeroButton.setEnabled(True)
-        self.jogAzRightButton.setEnabled(True)
-        self.jogAzSubmitButton.setEnabled(True)
-        self.jogElUpButton.setEnabled(True)
-        self.jogElZeroButton.setEnabled(True)
-        self.jogElDownButton.setEnabled(True)
-        self.jogElSubmitButton.setEnabled(True)
-        self.setZeroButton.setEnabled(True)
-        self.returnToZeroButton.setEnabled(True)
+        self._set_jog_buttons_enabled(True)
 
     def disable_jog_buttons(self) -> None:
-        self.jogAzLeftButton.setEnabled(False)
-        self.jogAzZeroButton.setEnabled(False)
-        self.jogAzRightButton.setEnabled(False)
-        self.jogAzSubmitButton.setEnabled(False)
-        self.jogElUpButton.setEnabled(False)
-        self.jogElZeroButton.setEnabled(False)
-        self.jogElDownButton.setEnabled(False)
-        self.jogElSubmitButton.setEnabled(False)
-        self.setZeroButton.setEnabled(False)
-        self.returnToZeroButton.setEnabled(False)
+        self._set_jog_buttons_enabled(False)
+
+    def _set_jog_buttons_enabled(self, enabled: bool) -> None:
+        # Only the buttons lock during a move. The step and jog-to inputs share
+        # their grid, so the jog buttons are set one by one with the box
+        # repainted once at the end, while the zero buttons have a container.
+        self.jogGroupBox.setUpdatesEnabled(False)
+        for btn in self._jog_buttons:
+            btn.setEnabled(enabled)
+        self.zeroButtonsWidget.setEnabled(enabled)
+        self.jogGroupBox.setUpdatesEnabled(True)
 
     def enable_freq(self) -> None:
         self.analyzerFreqGroupBox.setEnabled(True)
+        self._freq_ok = True
+        self._maybe_enable_experiment()
 
     def disable_freq(self) -> None:
         self.analyzerFreqGroupBox.setEnabled(False)
+        self._freq_ok = False
+        self._maybe_enable_experiment()
 
-    def enable_experiment(self) -> None:
-        if self.analyzerFreqGroupBox.isEnabled() and self.jogGroupBox.isEnabled():
-            self.experimentGroupBox.setEnabled(True)
+    def _maybe_enable_experiment(self) -> None:
+        # Experiments need both an analyzer and a positioner connected
+        self.experimentGroupBox.setEnabled(self._freq_ok and self._jog_ok)
 
     def disable_experiment(self) -> None:
         self.experimentGroupBox.setEnabled(False)
 
     def update_polar_plot_freqs(self) -> None:
         start = self.analyzer_start_freq
-        stop = self.analyzer_start_freq
-        step = self.analyzer_start_freq
-
-        if start:
-            self.polarPlotFreqSpinBox.setMinimum(start)
-        if stop:
-            self.polarPlotFreqSpinBox.setMaximum(stop)
-        if step:
-            self.polarPlotFreqSpinBox.setMinimum(step)
+        stop = self.analyzer_stop_freq
+        step = self.analyzer_freq_step
+
+        # Only touch limits that actually moved, and let any resulting clamp of
+        # the value go out as one valueChanged instead of one per setter
+        box = self.polarPlotFreqSpinBox
+        old = box.value()
+        blocker = QSignalBlocker(box)
+        if start and start != box.minimum():
+            box.setMinimum(start)
+        if stop and stop != box.maximum():
+            box.setMaximum(stop)
+        if step and step != box.singleStep():
+            box.setSingleStep(step)
+        blocker.unblock()
+
+        if box.value() != old:
+            box.valueChanged.emit(box.value())
 
     def update_plot_pols(self, pols: List[str]) -> None:
-        self.polarPlotPolarizationComboBox.blockSignals(True)
-        self.polarPlotFreqSpinBox.blockSignals(True)
-        self.overFreqPlotPolarizationComboBox.blockSignals(True)
-
-        self.polarPlotPolarizationComboBox.clear()
-        self.polarPlotPolarizationComboBox.addItems(pols)
-        self.overFreqPlotPolarizationComboBox.clear()
-        self.overFreqPlotPolarizationComboBox.addItems(pols)
-
-        self.polarPlotPolarizationComboBox.blockSignals(False)
-        self.polarPlotFreqSpinBox.blockSignals(False)
-        self.overFreqPlotPolarizationComboBox.blockSignals(False)
+        with _signals_blocked(
+            self.polarPlotPolarizationComboBox,
+            self.polarPlotFreqSpinBox,
+            self.overFreqPlotPolarizationComboBox,
+        ):
+            self.polarPlotPolarizationComboBox.clear()
+            self.polarPlotPolarizationComboBox.addItems(pols)
+            self.overFreqPlotPolarizationComboBox.clear()
+            self.overFreqPlotPolarizationComboBox.addItems(pols)
 
     def setupMenuBar(self) -> None:
         self.menu = self.menuBar()
@@ -547,8 +729,8 @@ class MainWindow(QMainWindow):
 
         self.positionerExtentsGroupBox = QGroupBox(self.positionerGroupBox)
         self.positionerExtentsGroupBoxLayout = QHBoxLayout(self.positionerExtentsGroupBox)
-        self.setupAzExtentWidgets()
-        self.setupElExtentWidgets()
+        self.setupExtentWidgets('Az', "Azimuth")
+        self.setupExtentWidgets('El', "Elevation")
         self.positionerGroupBoxLayout.addWidget(self.positionerExtentsGroupBox)
 
         self.jogGroupBox = QGroupBox(self.positionerGroupBox)
@@ -558,134 +740,60 @@ class MainWindow(QMainWindow):
 
         self.leftSideLayout.addWidget(self.positionerGroupBox)
 
-    def setupAzExtentWidgets(self) -> None:
-        self.positionerAzExtentLayout = QVBoxLayout()
-        self.positionerAzExtentLabel = QLabel("Azimuth", self.positionerExtentsGroupBox)
-        self.positionerAzExtentLayout.addWidget(self.positionerAzExtentLabel)
-
-        self.positionerAzStartHLayout = QHBoxLayout()
-        self.positionerAzExtentStartLabel = QLabel(
-            "Start", self.positionerExtentsGroupBox
-        )
-        self.positionerAzExtentStartSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerAzStartHLayout.addWidget(self.positionerAzExtentStartLabel)
-        self.positionerAzStartHLayout.addWidget(self.positionerAzExtentStartSpinBox)
-        self.positionerAzExtentLayout.addLayout(self.positionerAzStartHLayout)
-
-        self.positionerAzStopHLayout = QHBoxLayout()
-        self.positionerAzExtentStopLabel = QLabel("Stop", self.positionerExtentsGroupBox)
-        self.positionerAzExtentStopSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerAzStopHLayout.addWidget(self.positionerAzExtentStopLabel)
-        self.positionerAzStopHLayout.addWidget(self.positionerAzExtentStopSpinBox)
-        self.positionerAzExtentLayout.addLayout(self.positionerAzStopHLayout)
-
-        self.positionerAzStepHLayout = QHBoxLayout()
-        self.positionerAzExtentStepLabel = QLabel("Step", self.positionerExtentsGroupBox)
-        self.positionerAzExtentStepSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerAzStepHLayout.addWidget(self.positionerAzExtentStepLabel)
-        self.positionerAzStepHLayout.addWidget(self.positionerAzExtentStepSpinBox)
-        self.positionerAzExtentLayout.addLayout(self.positionerAzStepHLayout)
-
-        self.positionerExtentsGroupBoxLayout.addLayout(self.positionerAzExtentLayout)
-
-    def setupElExtentWidgets(self) -> None:
-        self.positionerElExtentLayout = QVBoxLayout()
-        self.positionerElExtentLabel = QLabel("Elevation", self.positionerExtentsGroupBox)
-        self.positionerElExtentLayout.addWidget(self.positionerElExtentLabel)
-
-        self.positionerElStartHLayout = QHBoxLayout()
-        self.positionerElExtentStartLabel = QLabel(
-            "Start", self.positionerExtentsGroupBox
-        )
-        self.positionerElExtentStartSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerElStartHLayout.addWidget(self.positionerElExtentStartLabel)
-        self.positionerElStartHLayout.addWidget(self.positionerElExtentStartSpinBox)
-        self.positionerElExtentLayout.addLayout(self.positionerElStartHLayout)
-
-        self.positionerElStopHLayout = QHBoxLayout()
-        self.positionerElExtentStopLabel = QLabel("Stop", self.positionerExtentsGroupBox)
-        self.positionerElExtentStopSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerElStopHLayout.addWidget(self.positionerElExtentStopLabel)
-        self.positionerElStopHLayout.addWidget(self.positionerElExtentStopSpinBox)
-        self.positionerElExtentLayout.addLayout(self.positionerElStopHLayout)
-
-        self.positionerElStepHLayout = QHBoxLayout()
-        self.positionerElExtentStepLabel = QLabel("Step", self.positionerExtentsGroupBox)
-        self.positionerElExtentStepSpinBox = QDoubleSpinBox(
-            self.positionerExtentsGroupBox
-        )
-        self.positionerElStepHLayout.addWidget(self.positionerElExtentStepLabel)
-        self.positionerElStepHLayout.addWidget(self.positionerElExtentStepSpinBox)
-        self.positionerElExtentLayout.addLayout(self.positionerElStepHLayout)
-
-        self.positionerExtentsGroupBoxLayout.addLayout(self.positionerElExtentLayout)
+    def setupExtentWidgets(self, axis: str, title: str) -> None:
+        # Builds positioner{axis}Extent{Start,Stop,Step}{Label,SpinBox} and their
+        # layouts; azimuth and elevation differ only in naming
+        box = self.positionerExtentsGroupBox
+        layout = QVBoxLayout()
+        label = QLabel(title, box)
+        layout.addWidget(label)
+        setattr(self, f'positioner{axis}ExtentLayout', layout)
+        setattr(self, f'positioner{axis}ExtentLabel', label)
+
+        for part in ('Start', 'Stop', 'Step'):
+            spin_box = QDoubleSpinBox(box)
+            part_label, hlayout = _labeled_hbox(box, part, spin_box)
+            layout.addLayout(hlayout)
+            setattr(self, f'positioner{axis}Extent{part}SpinBox', spin_box)
+            setattr(self, f'positioner{axis}Extent{part}Label', part_label)
+            setattr(self, f'positioner{axis}{part}HLayout', hlayout)
+
+        self.positionerExtentsGroupBoxLayout.addLayout(layout)
 
     def setupJogBox(self) -> None:
-        self.jogButtonsLayout = QGridLayout()
+        self.jogButtonsWidget = QWidget(self.jogGroupBox)
+        self.jogButtonsLayout = QGridLayout(self.jogButtonsWidget)
+        self.jogButtonsLayout.setContentsMargins(0, 0, 0, 0)
+        # Filled in by addJogButtons
+        self._jog_buttons: List[QPushButton] = []
 
         self.jogAzLabel = QLabel("Azimuth", self.jogGroupBox)
         self.jogAzStepLabel = QLabel("Step", self.jogGroupBox)
         self.jogAzToLabel = QLabel("Jog Azimuth To", self.jogGroupBox)
-        self.jogAzLeftButton = QPushButton(self.jogGroupBox)
-        self.jogAzLeftButton.setIcon(QIcon(QPixmap(":/icons/icons/LeftArrow.png")))
-        self.jogAzLeftButton.setIconSize(QSize(32, 32))
-        self.jogAzZeroButton = QPushButton("0", self.jogGroupBox)
-        self.jogAzRightButton = QPushButton(self.jogGroupBox)
-        self.jogAzRightButton.setIcon(QIcon(QPixmap(":/icons/icons/RightArrow.png")))
-        self.jogAzRightButton.setIconSize(QSize(32, 32))
-        self.jogAzSubmitButton = QPushButton(self.jogGroupBox)
-        self.jogAzSubmitButton.setIcon(QIcon(QPixmap(":/icons/icons/Check.png")))
-        self.jogAzSubmitButton.setIconSize(QSize(32, 32))
+        self.addJogButtons(self._AZ_JOG_BUTTONS)
         self.jogAzStepSpinBox = QDoubleSpinBox(self.jogGroupBox)
         self.jogAzToLineEdit = QLineEdit(self.jogGroupBox)
 
         self.jogButtonsLayout.addWidget(self.jogAzLabel, 0, 0, 1, 3)
         self.jogButtonsLayout.addWidget(self.jogAzStepLabel, 0, 3, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogAzToLabel, 0, 4, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogAzLeftButton, 1, 0, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogAzZeroButton, 1, 1, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogAzRightButton, 1, 2, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogAzStepSpinBox, 1, 3, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogAzToLineEdit, 1, 4, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogAzSubmitButton, 1, 5, 1, 1)
 
         self.jogElLabel = QLabel("Elevation", self.jogGroupBox)
         self.jogElStepLabel = QLabel("Step", self.jogGroupBox)
         self.jogElToLabel = QLabel("Jog Elevation To", self.jogGroupBox)
-        self.jogElUpButton = QPushButton("", self.jogGroupBox)
-        self.jogElUpButton.setIcon(QIcon(QPixmap(":/icons/icons/UpArrow.png")))
-        self.jogElUpButton.setIconSize(QSize(32, 32))
-        self.jogElZeroButton = QPushButton("0", self.jogGroupBox)
-        self.jogElDownButton = QPushButton("", self.jogGroupBox)
-        self.jogElDownButton.setIcon(QIcon(QPixmap(":/icons/icons/DownArrow.png")))
-        self.jogElDownButton.setIconSize(QSize(32, 32))
-        self.jogElSubmitButton = QPushButton("", self.jogGroupBox)
-        self.jogElSubmitButton.setIcon(QIcon(QPixmap(":/icons/icons/Check.png")))
-        self.jogElSubmitButton.setIconSize(QSize(32, 32))
+        self.addJogButtons(self._EL_JOG_BUTTONS)
         self.jogElStepSpinBox = QDoubleSpinBox(self.jogGroupBox)
         self.jogElToLineEdit = QLineEdit(self.jogGroupBox)
 
         self.jogButtonsLayout.addWidget(self.jogElLabel, 2, 0, 1, 3)
         self.jogButtonsLayout.addWidget(self.jogElStepLabel, 2, 3, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogElToLabel, 2, 4, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogElUpButton, 3, 0, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogElZeroButton, 3, 1, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogElDownButton, 3, 2, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogElStepSpinBox, 3, 3, 1, 1)
         self.jogButtonsLayout.addWidget(self.jogElToLineEdit, 3, 4, 1, 1)
-        self.jogButtonsLayout.addWidget(self.jogElSubmitButton, 3, 5, 1, 1)
 
-        self.jogGroupBoxLayout.addLayout(self.jogButtonsLayout)
+        self.jogGroupBoxLayout.addWidget(self.jogButtonsWidget)
 
         self.positionerPosLayout = QHBoxLayout()
         self.azPositionLayout = QVBoxLayout()
@@ -702,19 +810,33 @@ class MainWindow(QMainWindow):
         self.elPositionLayout.addWidget(self.elPositionLabel)
         self.elPositionLayout.addWidget(self.elPositionLineEdit)
 
-        self.zeroButtonLayout = QHBoxLayout()
-        self.setZeroButton = QPushButton("Set 0,0", self.jogGroupBox)
-        self.returnToZeroButton = QPushButton("Return to 0,0", self.jogGroupBox)
+        # The zero buttons sit in their own container so they can be locked out
+        # during a move with one setEnabled
+        self.zeroButtonsWidget = QWidget(self.jogGroupBox)
+        self.zeroButtonLayout = QHBoxLayout(self.zeroButtonsWidget)
+        self.zeroButtonLayout.setContentsMargins(0, 0, 0, 0)
+        self.setZeroButton = QPushButton("Set 0,0", self.zeroButtonsWidget)
+        self.returnToZeroButton = QPushButton("Return to 0,0", self.zeroButtonsWidget)
         self.zeroButtonLayout.addWidget(self.setZeroButton)
         self.zeroButtonLayout.addWidget(self.returnToZeroButton)
 
         self.positionerPosLayout.addLayout(self.azPositionLayout)
         self.positionerPosLayout.addLayout(self.elPositionLayout)
         self.jogGroupBoxLayout.addLayout(self.positionerPosLayout)
-        self.jogGroupBoxLayout.addLayout(self.zeroButtonLayout)
+        self.jogGroupBoxLayout.addWidget(self.zeroButtonsWidget)
 
         self.jogGroupBox.setEnabled(False)
 
+    def addJogButtons(self, buttons: Sequence[_JogButton]) -> None:
+        for name, text, icon, row, col in buttons:
+            btn = QPushButton(text, self.jogButtonsWidget)
+            if icon is not None:
+                btn.setIcon(_icon(icon))
+                btn.setIconSize(_ICON_SIZE)
+            setattr(self, name, btn)
+            self._jog_buttons.append(btn)
+            self.jogButtonsLayout.addWidget(btn, row, col, 1, 1)
+
     def setupExperimentGroupBox(self) -> None:
         self.experimentGroupBox = QGroupBox("Experiment", self.centralwidget)
         self.experimentGroupBoxLayout = QHBoxLayout(self.experimentGroupBox)
@@ -771,8 +893,20 @@ class MainWindow(QMainWindow):
         self.setupPolarPlotTab()
         self.setupOverFreqPlotTab()
 
+        # The controls above are wired up by the controller straight away, but
+        # each plot canvas waits until its tab is first shown
+        self._tab_initializers = {
+            self.tabWidget.indexOf(self.polarPlotTab): self.setupPolarPlot,
+            self.tabWidget.indexOf(self.overFreqPlotTab): self.setupOverFreqPlot,
+        }
+        self.tabWidget.currentChanged.connect(self._lazy_init_tab)
+
         self.rightSideLayout.addWidget(self.tabWidget)
 
+    def _lazy_init_tab(self, idx: int) -> None:
+        if (init := self._tab_initializers.pop(idx, None)) is not None:
+            init()
+
     def setupPolarPlotTab(self) -> None:
         tab = self.polarPlotTab
         self.polarPlotTabLayout = QVBoxLayout(tab)
@@ -792,22 +926,46 @@ class MainWindow(QMainWindow):
         self.polarPlotStepLabel = QLabel("dB/div", tab)
         self.polarPlotStepSpinBox = QSpinBox(tab)
 
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotPolarizationLabel)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotPolarizationComboBox)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotFreqLabel)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotFreqSpinBox)
-        self.polarPlotSettingsHLayout.addItem(spacer)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotAutoScaleButton)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotMinLabel)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotMinSpinBox)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotMaxLabel)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotMaxSpinBox)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotStepLabel)
-        self.polarPlotSettingsHLayout.addWidget(self.polarPlotStepSpinBox)
+        _add_widgets(
+            self.polarPlotSettingsHLayout,
+            self.polarPlotPolarizationLabel,
+            self.polarPlotPolarizationComboBox,
+            self.polarPlotFreqLabel,
+            self.polarPlotFreqSpinBox,
+            spacer,
+            self.polarPlotAutoScaleButton,
+            self.polarPlotMinLabel,
+            self.polarPlotMinSpinBox,
+            self.polarPlotMaxLabel,
+            self.polarPlotMaxSpinBox,
+            self.polarPlotStepLabel,
+            self.polarPlotStepSpinBox,
+        )
         self.polarPlotTabLayout.addLayout(self.polarPlotSettingsHLayout)
 
-        self.polarPlot = MplPolarWidget('tab:blue', tab)
-        self.polarPlotTabLayout.addWidget(self.polarPlot)
+    def setupPolarPlot(self) -> None:
+        from .mplwidget import MplPolarWidget
+
+        self._polarPlot = MplPolarWidget('tab:blue', self.polarPlotTab)
+        self.polarPlotTabLayout.addWidget(self._polarPlot)
+
+        self._polarPlot.set_scale(
+            min=self.polar_plot_min, max=self.polar_plot_max, step=self.polar_plot_step
+        )
+        # A held arrow or a multi-digit entry restarts the timer on every value,
+        # so the plot only redraws once the edits stop
+        self._polarScaleTimer = _debounced(self, self.applyPolarPlotScale)
+        for box in (
+            self.polarPlotMinSpinBox,
+            self.polarPlotMaxSpinBox,
+            self.polarPlotStepSpinBox,
+        ):
+            box.valueChanged.connect(lambda _: self._polarScaleTimer.start())
+
+    def applyPolarPlotScale(self) -> None:
+        self.polarPlot.set_scale(
+            min=self.polar_plot_min, max=self.polar_plot_max, step=self.polar_plot_step
+        )
 
     def setupOverFreqPlotTab(self) -> None:
         tab = self.overFreqPlotTab
@@ -826,16 +984,19 @@ class MainWindow(QMainWindow):
         self.overFreqPlotStepLabel = QLabel("dB/div", tab)
         self.overFreqPlotStepSpinBox = QSpinBox(tab)
 
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotPolarizationLabel)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotPolarizationComboBox)
-        self.overFreqPlotSettingsHLayout1.addItem(spacer)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotAutoScaleButton)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotMinLabel)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotMinSpinBox)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotMaxLabel)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotMaxSpinBox)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotStepLabel)
-        self.overFreqPlotSettingsHLayout1.addWidget(self.overFreqPlotStepSpinBox)
+        _add_widgets(
+            self.overFreqPlotSettingsHLayout1,
+            self.overFreqPlotPolarizationLabel,
+            self.overFreqPlotPolarizationComboBox,
+            spacer,
+            self.overFreqPlotAutoScaleButton,
+            self.overFreqPlotMinLabel,
+            self.overFreqPlotMinSpinBox,
+            self.overFreqPlotMaxLabel,
+            self.overFreqPlotMaxSpinBox,
+            self.overFreqPlotStepLabel,
+            self.overFreqPlotStepSpinBox,
+        )
 
         self.overFreqPlotSettingsHLayout2 = QHBoxLayout()
         self.overFreqPlotAzLabel = QLabel("Azimuth", tab)
@@ -844,135 +1005,174 @@ class MainWindow(QMainWindow):
         self.overFreqPlotElSpinBox = QDoubleSpinBox(tab)
         spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
 
-        self.overFreqPlotSettingsHLayout2.addWidget(self.overFreqPlotAzLabel)
-        self.overFreqPlotSettingsHLayout2.addWidget(self.overFreqPlotAzSpinBox)
-        self.overFreqPlotSettingsHLayout2.addWidget(self.overFreqPlotElLabel)
-        self.overFreqPlotSettingsHLayout2.addWidget(self.overFreqPlotElSpinBox)
-        self.overFreqPlotSettingsHLayout2.addItem(spacer)
+        _add_widgets(
+            self.overFreqPlotSettingsHLayout2,
+            self.overFreqPlotAzLabel,
+            self.overFreqPlotAzSpinBox,
+            self.overFreqPlotElLabel,
+            self.overFreqPlotElSpinBox,
+            spacer,
+        )
 
         self.overFreqPlotTabLayout.addLayout(self.overFreqPlotSettingsHLayout1)
         self.overFreqPlotTabLayout.addLayout(self.overFreqPlotSettingsHLayout2)
 
-        self.overFreqPlot = MplRectWidget('tab:blue', tab)
-        self.overFreqPlotTabLayout.addWidget(self.overFreqPlot)
+    def setupOverFreqPlot(self) -> None:
+        from .mplwidget import MplRectWidget
+
+        self._overFreqPlot = MplRectWidget('tab:blue', self.overFreqPlotTab)
+        self.overFreqPlotTabLayout.addWidget(self._overFreqPlot)
+
+        self._overFreqPlot.set_xtitle("Frequency")
+        self._overFreqPlot.set_ytitle("Gain [dB]")
+        self._overFreqPlot.set_scale(
+            min=self.over_freq_plot_min,
+            max=self.over_freq_plot_max,
+            step=self.over_freq_plot_step,
+        )
+        self._overFreqScaleTimer = _debounced(self, self.applyOverFreqPlotScale)
+        for box in (
+            self.overFreqPlotMinSpinBox,
+            self.overFreqPlotMaxSpinBox,
+            self.overFreqPlotStepSpinBox,
+        ):
+            box.valueChanged.connect(lambda _: self._overFreqScaleTimer.start())
+
+    def applyOverFreqPlotScale(self) -> None:
+        self.overFreqPlot.set_scale(
+            min=self.over_freq_plot_min,
+            max=self.over_freq_plot_max,
+            step=self.over_freq_plot_step,
+        )
 
     def updateSizePolicies(self) -> None:
-        self.analyzerModelLabel.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerModelComboBox.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerAddressLabel.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerAddressComboBox.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerConnectButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerPol1Label.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerPol1ComboBox.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerPol2Label.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerPol2ComboBox.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerFreqGroupBox.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.analyzerStartFreqLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.analyzerStopFreqLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.analyzerStepFreqLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.analyzerNPointsLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.analyzerStartFreqLineEdit.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerStopFreqLineEdit.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerStepFreqLineEdit.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.analyzerNPointsLineEdit.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-
-        self.positionerModelLabel.setSizePolicy(_SIZE_POLICIES["min_pref"])
-        self.positionerModelComboBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerPortLabel.setSizePolicy(_SIZE_POLICIES["min_pref"])
-        self.positionerPortComboBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerConnectButton.setSizePolicy(_SIZE_POLICIES["min_pref"])
-
-        self.positionerAzExtentStartSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerAzExtentStopSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerAzExtentStepSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerElExtentStartSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerElExtentStopSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-        self.positionerElExtentStepSpinBox.setSizePolicy(_SIZE_POLICIES["exp_pref"])
-
-        self.jogAzLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogAzStepLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogAzToLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogAzLeftButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogAzZeroButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogAzRightButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogAzStepSpinBox.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogAzToLineEdit.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.jogAzSubmitButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-
-        self.jogElLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogElStepLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogElToLabel.setSizePolicy(_SIZE_POLICIES['pref_min'])
-        self.jogElUpButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogElZeroButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogElDownButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogElStepSpinBox.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.jogElToLineEdit.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.jogElSubmitButton.setSizePolicy(_SIZE_POLICIES['min_pref'])
-
-        self.azPositionLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.azPositionLineEdit.setSizePolicy(_SIZE_POLICIES['min_pref'])
-        self.elPositionLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.elPositionLineEdit.setSizePolicy(_SIZE_POLICIES['min_pref'])
-
-        self.experimentFullScanButton.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentAzScanButton.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentElScanButton.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentAbortButton.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentTotalProgressLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.experimentTotalProgressBar.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentCutProgressLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.experimentCutProgressBar.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-        self.experimentTimeRemainingLabel.setSizePolicy(_SIZE_POLICIES['pref_pref'])
-        self.experimentTimeRemainingLineEdit.setSizePolicy(_SIZE_POLICIES['exp_pref'])
-
-        self.polarPlotFreqSpinBox.setSizePolicy(_SIZE_POLICIES['pref_pref'])
+        # Each policy is looked up once and shared by every widget that uses it
+        min_pref = _size_policy('min_pref')
+        exp_pref = _size_policy('exp_pref')
+        pref_pref = _size_policy('pref_pref')
+        pref_min = _size_policy('pref_min')
+
+        for widget in (
+            self.analyzerModelLabel,
+            self.analyzerAddressLabel,
+            self.analyzerConnectButton,
+            self.analyzerPol1Label,
+            self.analyzerPol2Label,
+            self.analyzerFreqGroupBox,
+            self.positionerModelLabel,
+            self.positionerPortLabel,
+            self.positionerConnectButton,
+            self.jogAzLeftButton,
+            self.jogAzZeroButton,
+            self.jogAzRightButton,
+            self.jogAzStepSpinBox,
+            self.jogAzSubmitButton,
+            self.jogElUpButton,
+            self.jogElZeroButton,
+            self.jogElDownButton,
+            self.jogElStepSpinBox,
+            self.jogElSubmitButton,
+            self.azPositionLineEdit,
+            self.elPositionLineEdit,
+        ):
+            widget.setSizePolicy(min_pref)
+
+        for widget in (
+            self.analyzerModelComboBox,
+            self.analyzerAddressComboBox,
+            self.analyzerPol1ComboBox,
+            self.analyzerPol2ComboBox,
+            self.analyzerStartFreqLineEdit,
+            self.analyzerStopFreqLineEdit,
+            self.analyzerStepFreqLineEdit,
+            self.analyzerNPointsLineEdit,
+            self.positionerModelComboBox,
+            self.positionerPortComboBox,
+            self.positionerAzExtentStartSpinBox,
+            self.positionerAzExtentStopSpinBox,
+            self.positionerAzExtentStepSpinBox,
+            self.positionerElExtentStartSpinBox,
+            self.positionerElExtentStopSpinBox,
+            self.positionerElExtentStepSpinBox,
+            self.experimentFullScanButton,
+            self.experimentAzScanButton,
+            self.experimentElScanButton,
+            self.experimentAbortButton,
+            self.experimentTotalProgressBar,
+            self.experimentCutProgressBar,
+            self.experimentTimeRemainingLineEdit,
+        ):
+            widget.setSizePolicy(exp_pref)
+
+        # Labels already default to Preferred/Preferred, so only widgets whose
+        # own default differs are listed
+        for widget in (
+            self.jogAzToLineEdit,
+            self.jogElToLineEdit,
+            self.polarPlotFreqSpinBox,
+        ):
+            widget.setSizePolicy(pref_pref)
+
+        for widget in (
+            self.jogAzLabel,
+            self.jogAzStepLabel,
+            self.jogAzToLabel,
+            self.jogElLabel,
+            self.jogElStepLabel,
+            self.jogElToLabel,
+        ):
+            widget.setSizePolicy(pref_min)
+
         self.polarPlotFreqSpinBox.setMinimumWidth(100)
 
     def updateFonts(self) -> None:
-        self.positionerAzExtentLabel.setFont(_FONTS["bold_14"])
-        self.positionerAzExtentLabel.setAlignment(Qt.AlignHCenter)
-        self.positionerElExtentLabel.setFont(_FONTS["bold_14"])
-        self.positionerElExtentLabel.setAlignment(Qt.AlignHCenter)
-
-        self.jogAzLabel.setFont(_FONTS["bold_12"])
-        self.jogAzLabel.setAlignment(Qt.AlignHCenter)
-        self.jogAzStepLabel.setFont(_FONTS["bold_12"])
-        self.jogAzStepLabel.setAlignment(Qt.AlignHCenter)
-        self.jogAzToLabel.setFont(_FONTS["bold_12"])
-        self.jogAzToLabel.setAlignment(Qt.AlignHCenter)
-        self.jogAzZeroButton.setFont(_FONTS["bold_20"])
-        self.jogElLabel.setFont(_FONTS["bold_12"])
-        self.jogElLabel.setAlignment(Qt.AlignHCenter)
-        self.jogElStepLabel.setFont(_FONTS["bold_12"])
-        self.jogElStepLabel.setAlignment(Qt.AlignHCenter)
-        self.jogElToLabel.setFont(_FONTS["bold_12"])
-        self.jogElToLabel.setAlignment(Qt.AlignHCenter)
-        self.jogElZeroButton.setFont(_FONTS["bold_20"])
-
-        self.azPositionLabel.setFont(_FONTS["bold_12"])
-        self.azPositionLabel.setAlignment(Qt.AlignHCenter)
-        self.azPositionLineEdit.setFont(_FONTS["bold_20_ibm"])
-        self.elPositionLabel.setFont(_FONTS["bold_12"])
-        self.elPositionLabel.setAlignment(Qt.AlignHCenter)
-        self.elPositionLineEdit.setFont(_FONTS["bold_20_ibm"])
-
-        self.experimentFullScanButton.setFont(_FONTS["bold_12"])
-        self.experimentAzScanButton.setFont(_FONTS["bold_12"])
-        self.experimentElScanButton.setFont(_FONTS["bold_12"])
-        self.experimentAbortButton.setFont(_FONTS["bold_12"])
-
-        self.experimentTotalProgressLabel.setFont(_FONTS["bold_12"])
-        self.experimentTotalProgressLabel.setAlignment(Qt.AlignHCenter)
-        self.experimentCutProgressLabel.setFont(_FONTS["bold_12"])
-        self.experimentCutProgressLabel.setAlignment(Qt.AlignHCenter)
-        self.experimentTimeRemainingLabel.setFont(_FONTS["bold_12"])
-        self.experimentTimeRemainingLabel.setAlignment(Qt.AlignHCenter)
+        bold_12 = _font('bold_12')
+        bold_14 = _font('bold_14')
+        bold_20 = _font('bold_20')
+        bold_20_ibm = _font('bold_20_ibm')
+
+        # Headings are bold and centred over their controls
+        for label, font in (
+            (self.positionerAzExtentLabel, bold_14),
+            (self.positionerElExtentLabel, bold_14),
+            (self.jogAzLabel, bold_12),
+            (self.jogAzStepLabel, bold_12),
+            (self.jogAzToLabel, bold_12),
+            (self.jogElLabel, bold_12),
+            (self.jogElStepLabel, bold_12),
+            (self.jogElToLabel, bold_12),
+            (self.azPositionLabel, bold_12),
+            (self.elPositionLabel, bold_12),
+            (self.experimentTotalProgressLabel, bold_12),
+            (self.experimentCutProgressLabel, bold_12),
+            (self.experimentTimeRemainingLabel, bold_12),
+        ):
+            label.setFont(font)
+            label.setAlignment(Qt.AlignHCenter)
+
+        self.jogAzZeroButton.setFont(bold_20)
+        self.jogElZeroButton.setFont(bold_20)
+        self.azPositionLineEdit.setFont(bold_20_ibm)
+        self.elPositionLineEdit.setFont(bold_20_ibm)
+
+        for button in (
+            self.experimentFullScanButton,
+            self.experimentAzScanButton,
+            self.experimentElScanButton,
+            self.experimentAbortButton,
+        ):
+            button.setFont(bold_12)
 
     def updateValidators(self) -> None:
-        self.jogAzToLineEdit.setValidator(QDoubleValidator(-360.0, 360.0, 2))
-        self.jogElToLineEdit.setValidator(QDoubleValidator(-360.0, 360.0, 2))
+        # Validators hold no per-widget state, so one of each is shared by this
+        # window's line edits. The window owns them, so they live exactly as
+        # long as the line edits using them. The frequency boxes take units
+        # (e.g. '2 GHz') and are checked on parse.
+        angle_validator = QDoubleValidator(-360.0, 360.0, 2, self)
+        self.jogAzToLineEdit.setValidator(angle_validator)
+        self.jogElToLineEdit.setValidator(angle_validator)
 
-        self.analyzerNPointsLineEdit.setValidator(QIntValidator())
+        self.analyzerNPointsLineEdit.setValidator(QIntValidator(self))
 
     def updateFromSettings(self, settings: SettingsManager) -> None:
         self.analyzerModelComboBox.setCurrentText(settings["analyzer-model"])
@@ -985,112 +1185,62 @@ class MainWindow(QMainWindow):
         self.analyzerPol2LineEdit.setText(settings["pol2-label"])
         self.analyzerPol2ComboBox.setCurrentText(settings["pol2-param"])
 
-        self.positionerAzExtentStartSpinBox.setValue(float(settings["az-start"]))
-        self.positionerAzExtentStopSpinBox.setValue(float(settings["az-stop"]))
-        self.positionerAzExtentStepSpinBox.setValue(float(settings["az-step"]))
-        self.positionerElExtentStartSpinBox.setValue(float(settings["el-start"]))
-        self.positionerElExtentStopSpinBox.setValue(float(settings["el-stop"]))
-        self.positionerElExtentStepSpinBox.setValue(float(settings["el-step"]))
+        # These values came from the settings, so there is nothing to write back
+        extent_boxes = {
+            "az-start": self.positionerAzExtentStartSpinBox,
+            "az-stop": self.positionerAzExtentStopSpinBox,
+            "az-step": self.positionerAzExtentStepSpinBox,
+            "el-start": self.positionerElExtentStartSpinBox,
+            "el-stop": self.positionerElExtentStopSpinBox,
+            "el-step": self.positionerElExtentStepSpinBox,
+        }
+        with _signals_blocked(*extent_boxes.values()):
+            for key, box in extent_boxes.items():
+                box.setValue(float(settings[key]))
 
     def initInputs(self) -> None:
-        self.positionerAzExtentStartSpinBox.setMinimum(-180.0)
-        self.positionerAzExtentStartSpinBox.setMaximum(180.0)
-        self.positionerAzExtentStartSpinBox.setSingleStep(1.0)
-        self.positionerAzExtentStartSpinBox.setDecimals(2)
-        self.positionerAzExtentStartSpinBox.setValue(-90.0)
-
-        self.positionerAzExtentStopSpinBox.setMinimum(-180.0)
-        self.positionerAzExtentStopSpinBox.setMaximum(180.0)
-        self.positionerAzExtentStopSpinBox.setSingleStep(1.0)
-        self.positionerAzExtentStopSpinBox.setDecimals(2)
-        self.positionerAzExtentStopSpinBox.setValue(90.0)
-
-        self.positionerAzExtentStepSpinBox.setMinimum(0.0)
-        self.positionerAzExtentStepSpinBox.setMaximum(360.0)
-        self.positionerAzExtentStepSpinBox.setSingleStep(1.0)
-        self.positionerAzExtentStepSpinBox.setDecimals(2)
-        self.positionerAzExtentStepSpinBox.setValue(5.0)
-
-        self.positionerElExtentStartSpinBox.setMinimum(-180.0)
-        self.positionerElExtentStartSpinBox.setMaximum(180.0)
-        self.positionerElExtentStartSpinBox.setSingleStep(1.0)
-        self.positionerElExtentStartSpinBox.setDecimals(2)
-        self.positionerElExtentStartSpinBox.setValue(-90.0)
-
-        self.positionerElExtentStopSpinBox.setMinimum(-180.0)
-        self.positionerElExtentStopSpinBox.setMaximum(180.0)
-        self.positionerElExtentStopSpinBox.setSingleStep(1.0)
-        self.positionerElExtentStopSpinBox.setDecimals(2)
-        self.positionerElExtentStopSpinBox.setValue(90.0)
-
-        self.positionerElExtentStepSpinBox.setMinimum(0.0)
-        self.positionerElExtentStepSpinBox.setMaximum(360.0)
-        self.positionerElExtentStepSpinBox.setSingleStep(1.0)
-        self.positionerElExtentStepSpinBox.setDecimals(2)
-        self.positionerElExtentStepSpinBox.setValue(5.0)
-
-        self.jogAzStepSpinBox.setMinimum(0.0)
-        self.jogAzStepSpinBox.setMaximum(180.0)
-        self.jogAzStepSpinBox.setSingleStep(0.25)
-        self.jogAzStepSpinBox.setDecimals(2)
-        self.jogAzStepSpinBox.setValue(0.0)
-
-        self.jogElStepSpinBox.setMinimum(0.0)
-        self.jogElStepSpinBox.setMaximum(180.0)
-        self.jogElStepSpinBox.setSingleStep(0.25)
-        self.jogElStepSpinBox.setDecimals(2)
-        self.jogElStepSpinBox.setValue(0.0)
-
-        self.jogAzToLineEdit.setPlaceholderText("0.0")
-        self.jogElToLineEdit.setPlaceholderText("0.0")
-
-        self.polarPlotMinSpinBox.setMinimum(-100)
-        self.polarPlotMinSpinBox.setMaximum(100)
-        self.polarPlotMinSpinBox.setSingleStep(5)
-        self.polarPlotMinSpinBox.setValue(-30)
-
-        self.polarPlotMaxSpinBox.setMinimum(-100)
-        self.polarPlotMaxSpinBox.setMaximum(100)
-        self.polarPlotMaxSpinBox.setSingleStep(5)
-        self.polarPlotMaxSpinBox.setValue(0)
-
-        self.polarPlotStepSpinBox.setMinimum(1)
-        self.polarPlotStepSpinBox.setMaximum(100)
-        self.polarPlotStepSpinBox.setSingleStep(10)
-        self.polarPlotStepSpinBox.setValue(10)
-
-        self.overFreqPlotMinSpinBox.setMinimum(-100)
-        self.overFreqPlotMinSpinBox.setMaximum(100)
-        self.overFreqPlotMinSpinBox.setSingleStep(5)
-        self.overFreqPlotMinSpinBox.setValue(-30)
-
-        self.overFreqPlotMaxSpinBox.setMinimum(-100)
-        self.overFreqPlotMaxSpinBox.setMaximum(100)
-        self.overFreqPlotMaxSpinBox.setSingleStep(5)
-        self.overFreqPlotMaxSpinBox.setValue(0)
-
-        self.overFreqPlotStepSpinBox.setMinimum(1)
-        self.overFreqPlotStepSpinBox.setMaximum(100)
-        self.overFreqPlotStepSpinBox.setSingleStep(10)
-        self.overFreqPlotStepSpinBox.setValue(10)
-
-    def initPlots(self) -> None:
-        self.polarPlot.set_scale(
-            min=self.polar_plot_min, max=self.polar_plot_max, step=self.polar_plot_step
-        )
-        self.polarPlotMinSpinBox.valueChanged.connect(self.polarPlot.set_scale_min)
-        self.polarPlotMaxSpinBox.valueChanged.connect(self.polarPlot.set_scale_max)
-        self.polarPlotStepSpinBox.valueChanged.connect(self.polarPlot.set_scale_step)
-
-        self.overFreqPlot.set_xtitle("Frequency")
-        self.overFreqPlot.set_ytitle("Gain [dB]")
-        self.overFreqPlot.set_scale(
-            min=self.over_freq_plot_min,
-            max=self.over_freq_plot_max,
-            step=self.over_freq_plot_step,
-        )
-        self.overFreqPlotMinSpinBox.valueChanged.connect(self.overFreqPlot.set_scale_min)
-        self.overFreqPlotMaxSpinBox.valueChanged.connect(self.overFreqPlot.set_scale_max)
-        self.overFreqPlotStepSpinBox.valueChanged.connect(
-            self.overFreqPlot.set_scale_step
+        # Nothing should react to each default range and value as it is set
+        spin_boxes = (
+            self.positionerAzExtentStartSpinBox,
+            self.positionerAzExtentStopSpinBox,
+            self.positionerAzExtentStepSpinBox,
+            self.positionerElExtentStartSpinBox,
+            self.positionerElExtentStopSpinBox,
+            self.positionerElExtentStepSpinBox,
+            self.jogAzStepSpinBox,
+            self.jogElStepSpinBox,
+            self.polarPlotMinSpinBox,
+            self.polarPlotMaxSpinBox,
+            self.polarPlotStepSpinBox,
+            self.overFreqPlotMinSpinBox,
+            self.overFreqPlotMaxSpinBox,
+            self.overFreqPlotStepSpinBox,
         )
+        with _signals_blocked(*spin_boxes):
+            for box in (
+                self.positionerAzExtentStartSpinBox,
+                self.positionerElExtentStartSpinBox,
+            ):
+                _config_double_spin(box, -180.0, 180.0, 1.0, -90.0, decimals=2)
+            for box in (
+                self.positionerAzExtentStopSpinBox,
+                self.positionerElExtentStopSpinBox,
+            ):
+                _config_double_spin(box, -180.0, 180.0, 1.0, 90.0, decimals=2)
+            for box in (
+                self.positionerAzExtentStepSpinBox,
+                self.positionerElExtentStepSpinBox,
+            ):
+                _config_double_spin(box, 0.0, 360.0, 1.0, 5.0, decimals=2)
+            for box in (self.jogAzStepSpinBox, self.jogElStepSpinBox):
+                _config_double_spin(box, 0.0, 180.0, 0.25, 0.0, decimals=2)
+
+            self.jogAzToLineEdit.setPlaceholderText("0.0")
+            self.jogElToLineEdit.setPlaceholderText("0.0")
+
+            for box in (self.polarPlotMinSpinBox, self.overFreqPlotMinSpinBox):
+                _config_spin(box, -100, 100, 5, -30, accelerated=True)
+            for box in (self.polarPlotMaxSpinBox, self.overFreqPlotMaxSpinBox):
+                _config_spin(box, -100, 100, 5, 0, accelerated=True)
+            for box in (self.polarPlotStepSpinBox, self.overFreqPlotStepSpinBox):
+                _config_spin(box, 1, 100, 10, 10, accelerated=True)
@@ -3,6 +3,8 @@
     isort:skip_file
 """
 
+from typing import Any, Callable, Optional, Tuple
+
 from PyQt5.QtCore import QSize
 from PyQt5.QtWidgets import QSizePolicy, QWidget, QVBoxLayout
 from matplotlib.figure import Figure
@@ -24,11 +26,18 @@ class MplCanvas(Canvas):
 
 
 class MplWidget(QWidget):
+    canvas: MplCanvas
+    # Supplied by each subclass: creates self.ax and self.artist from the
+    # recorded settings and data
+    _setup_axes: Callable[[], None]
+
     def __init__(self, color: str, parent=None):
         QWidget.__init__(self, parent)
-        self.canvas = MplCanvas()
+        # The figure and canvas are built the first time the widget is shown.
+        # Until then updates only record their data and settings, so a plot that
+        # is never looked at costs no Matplotlib work.
+        self._ready = False
         self.vbl = QVBoxLayout()
-        self.vbl.addWidget(self.canvas)
         self.setLayout(self.vbl)
         policy = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         policy.setHeightForWidth(True)
@@ -36,6 +45,32 @@ class MplWidget(QWidget):
 
         self._grid = True
         self.color = color
+        self._xdata = np.array([0])
+        self._ydata = np.array([0])
+
+        # Background of the last full draw, minus the line, for blitting.
+        # Dropped on resize since it no longer fits the canvas.
+        self._bg: Any = None
+        self._view: Optional[tuple] = None
+        # (min, max, step) last applied to the value axis
+        self._scale: Optional[Tuple[float, float, float]] = None
+        # The (x, y) data currently on screen
+        self._painted: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def showEvent(self, event) -> None:
+        if not self._ready:
+            self._build()
+        super().showEvent(event)
+
+    def _build(self) -> None:
+        self.canvas = MplCanvas()
+        self.vbl.addWidget(self.canvas)
+        self._ready = True
+        self._setup_axes()
+        self.artist.set_animated(True)
+        self.canvas.mpl_connect('draw_event', self._capture_bg)
+        self.canvas.mpl_connect('resize_event', self._drop_bg)
+        self.update_plot(self._xdata, self._ydata)
 
     @property
     def grid(self) -> bool:
@@ -44,18 +79,55 @@ class MplWidget(QWidget):
     @grid.setter
     def grid(self, setting: bool) -> None:
         self._grid = setting
+        if self._ready:
+            self.ax.grid(setting)
+            self._view = None
 
     def sizeHint(self) -> QSize:
         return QSize(300, 300)
 
+    def _capture_bg(self, event) -> None:
+        # The line is animated, so full draws leave it out; save what they did
+        # draw, then put the line back on top
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.artist)
+        self._painted = (self._xdata, self._ydata)
+
+    def _is_painted(self) -> bool:
+        # Compared by value, since callers build fresh arrays for every update
+        if self._painted is None:
+            return False
+        x, y = self._painted
+        return np.array_equal(x, self._xdata) and np.array_equal(y, self._ydata)
+
+    def _drop_bg(self, event) -> None:
+        self._bg = None
+
+    def _redraw(self, view: tuple) -> None:
+        # Only the line moved: paint it over the saved background. Anything
+        # that changes the axes themselves needs a full draw, which is queued
+        # so a burst of changes costs one draw on the next event loop pass.
+        # Until it runs there is no valid background, so updates in between
+        # just join the pending draw.
+        if view == self._view and self._bg is not None:
+            # e.g. the over-frequency trace of a fixed point while other points
+            # are acquired; the screen already shows it
+            if self._is_painted():
+                return
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self.artist)
+            self.canvas.blit(self.ax.bbox)
+            self._painted = (self._xdata, self._ydata)
+        else:
+            self._view = view
+            self._bg = None
+            self.canvas.draw_idle()
+
 
 class MplRectWidget(MplWidget):
     def __init__(self, color: str, parent=None):
         super(MplRectWidget, self).__init__(color, parent)
 
-        self.ax = self.canvas.fig.add_subplot()
-        self.artist, *_ = self.ax.plot(np.array([0]), np.array([0]), color=self.color)
-        self.ax.grid(self.grid)
         self.xformatter = EngFormatter(unit='Hz')
         self.xtitle = ""
         self.ytitle = ""
@@ -65,26 +137,39 @@ class MplRectWidget(MplWidget):
         self.ymax = 0.0
         self.ystep = 10.0
 
-    def update_plot(self, xdata: np.ndarray, ydata: np.ndarray) -> None:
-        self.ax.cla()
-        self.artist, *_ = self.ax.plot(xdata, ydata, color=self.color)
+    def _setup_axes(self) -> None:
+        # The axes and line are set up once and then only have their data and
+        # limits updated, rather than being cleared and rebuilt on every redraw
+        self.ax = self.canvas.fig.add_subplot()
+        self.artist, *_ = self.ax.plot(self._xdata, self._ydata, color=self.color)
         self.ax.grid(self.grid)
         self.ax.xaxis.set_major_formatter(self.xformatter)
-        if len(xdata) > 1:
-            self.ax.set_xlim(np.amin(xdata), np.amax(xdata))
         self.ax.set_xlabel(self.xtitle)
         self.ax.set_ylabel(self.ytitle)
-        self.ax.set_ylim(self.ymin, self.ymax)
-        self.ax.set_yticks(np.arange(self.ymin, self.ymax + 1, self.ystep))
-        self.canvas.draw()
+
+    def update_plot(self, xdata: np.ndarray, ydata: np.ndarray) -> None:
+        if np.size(ydata) == 0:
+            # Nothing measured at the selected point (yet), so clear the line
+            xdata = ydata = np.array([])
+        self._xdata, self._ydata = xdata, ydata
+        if not self._ready:
+            return
+        self.artist.set_data(xdata, ydata)
+        if len(xdata) > 1:
+            self.ax.set_xlim(np.amin(xdata), np.amax(xdata))
+        # Limits and ticks only need touching when the scale itself changed
+        scale = (self.ymin, self.ymax, self.ystep)
+        if scale != self._scale:
+            self._scale = scale
+            self.ax.set_ylim(self.ymin, self.ymax)
+            self.ax.set_yticks(np.arange(self.ymin, self.ymax + 1, self.ystep))
+        self._redraw((self.ax.get_xlim(), *scale))
 
     def refresh_plot(self) -> None:
-        x = self.artist.get_xdata(orig=True)
-        y = self.artist.get_ydata(orig=True)
-        self.update_plot(x, y)
+        self.update_plot(self._xdata, self._ydata)
 
     def auto_scale(self) -> None:
-        y = self.artist.get_ydata(orig=True)
+        y = self._ydata
         if len(y) <= 1:
             return
         min = np.floor(np.amin(y))
@@ -112,9 +197,15 @@ class MplRectWidget(MplWidget):
 
     def set_xtitle(self, text: str) -> None:
         self.xtitle = text
+        if self._ready:
+            self.ax.set_xlabel(text)
+            self._view = None
 
     def set_ytitle(self, text: str) -> None:
         self.ytitle = text
+        if self._ready:
+            self.ax.set_ylabel(text)
+            self._view = None
 
 
 class MplPolarWidget(MplWidget):
@@ -127,11 +218,14 @@ class MplPolarWidget(MplWidget):
         self.rmax = 0.0
         self.rstep = 10.0
 
+    def _setup_axes(self) -> None:
         self.ax = self.canvas.fig.add_subplot(projection='polar')
         self.ax.set_theta_zero_location('N')
-        self.ax.set_thetagrids(np.arange(0, 360, 30))
-        self.artist, *_ = self.ax.plot(np.array([0]), np.array([0]), color=self.color)
-        self.canvas.draw()
+        self.ax.set_xticks(np.deg2rad(np.arange(-180, 180, 30)))
+        self.ax.set_thetalim(-np.pi, np.pi)
+        self.ax.grid(self.grid)
+        self.ax.tick_params(labelbottom=self.ticks, labelleft=self.ticks)
+        self.artist, *_ = self.ax.plot(self._xdata, self._ydata, color=self.color)
 
     @property
     def ticks(self) -> bool:
@@ -140,28 +234,30 @@ class MplPolarWidget(MplWidget):
     @ticks.setter
     def ticks(self, setting: bool) -> None:
         self._ticks = setting
+        if self._ready:
+            self.ax.tick_params(labelbottom=setting, labelleft=setting)
+            self._view = None
 
     def update_plot(self, xdata: np.ndarray, ydata: np.ndarray) -> None:
-        self.ax.cla()
-        self.artist, *_ = self.ax.plot(xdata, ydata, color=self.color)
-        if not self.ticks:
-            self.ax.set_xticklabels([])
-            self.ax.set_yticklabels([])
-        self.ax.grid(self.grid)
-        self.ax.set_theta_zero_location('N')
-        self.ax.set_xticks(np.deg2rad(np.arange(-180, 180, 30)))
-        self.ax.set_thetalim(-np.pi, np.pi)
-        self.ax.set_rlim(self.rmin, self.rmax)
-        self.ax.set_rticks(np.arange(self.rmin, self.rmax + 1, self.rstep))
-        self.canvas.draw()
+        if np.size(ydata) == 0:
+            # Nothing measured at the selected point (yet), so clear the line
+            xdata = ydata = np.array([])
+        self._xdata, self._ydata = xdata, ydata
+        if not self._ready:
+            return
+        self.artist.set_data(xdata, ydata)
+        scale = (self.rmin, self.rmax, self.rstep)
+        if scale != self._scale:
+            self._scale = scale
+            self.ax.set_rlim(self.rmin, self.rmax)
+            self.ax.set_rticks(np.arange(self.rmin, self.rmax + 1, self.rstep))
+        self._redraw(scale)
 
     def refresh_plot(self) -> None:
-        x = self.artist.get_xdata(orig=True)
-        y = self.artist.get_ydata(orig=True)
-        self.update_plot(x, y)
+        self.update_plot(self._xdata, self._ydata)
 
     def auto_scale(self) -> None:
-        y = self.artist.get_ydata(orig=True)
+        y = self._ydata
         if len(y) <= 1:
             return
         min = np.floor(np.amin(y))
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import List
 
 from PyQt5.QtWidgets import QMessageBox
 
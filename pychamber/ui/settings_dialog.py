@@ -1,8 +1,5 @@
-import pathlib
-
 from classes.settings_manager import SettingsManager
 from PyQt5.QtWidgets import QComboBox, QDialog, QDialogButtonBox, QFileDialog, QFormLayout
-from pyvisa.util import get_system_details
 from ui import pyconsole
 
 
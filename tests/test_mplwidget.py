@@ -0,0 +1,34 @@
+"""Tests for `pychamber.ui.mplwidget`."""
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from pychamber.ui.mplwidget import MplPolarWidget, MplRectWidget  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def app():
+    """The QApplication every widget needs, shared across the module."""
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.mark.parametrize('cls', [MplRectWidget, MplPolarWidget])
+def test_no_data_clears_the_line(app, cls):
+    """An unmeasured point gives no magnitudes, which blanks the plot."""
+    widget = cls('tab:blue')
+    widget.show()
+    app.processEvents()
+    x = np.linspace(1e9, 2e9, 5).reshape(-1, 1)
+
+    widget.update_plot(x, np.zeros_like(x))
+    widget.update_plot(x, np.array([]))
+    widget.canvas.draw()
+
+    assert widget.artist.get_xdata().size == 0
+    assert widget.artist.get_ydata().size == 0
+    widget.close()
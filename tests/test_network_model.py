@@ -0,0 +1,220 @@
+"""Tests for `pychamber.classes.network_model`."""
+from unittest import mock
+
+import cloudpickle
+import numpy as np
+import pytest
+import skrf
+from skrf.networkSet import NetworkSet
+
+from pychamber.classes import network_model
+from pychamber.classes.network_model import NetworkModel
+
+FREQ = skrf.Frequency(1, 3, 5, 'ghz')  # 1, 1.5, 2, 2.5, 3 GHz
+
+
+def make_ntwk(azimuth: float, elevation: float) -> skrf.Network:
+    """Build a one-port trace, as the analyzer returns, unique to its position."""
+    s = (1.0 + 0.01 * azimuth + 0.1 * elevation) * np.arange(1, len(FREQ) + 1)
+    s = s.reshape(-1, 1, 1).astype(complex)
+    ntwk = skrf.Network(frequency=FREQ, s=s)
+    ntwk.params = {'azimuth': azimuth, 'elevation': elevation}
+    return ntwk
+
+
+@pytest.fixture
+def model():
+    """A 3x2 grid of (azimuth, elevation) points, built in scan order."""
+    return NetworkModel([make_ntwk(az, el) for az in (-10, 0, 10) for el in (0, 5)])
+
+
+def test_freq_on_grid(model):
+    """Grid frequencies resolve with or without units, and without a warning."""
+    with mock.patch.object(network_model.log, 'warning') as warning:
+        assert model._resolve_freq(str(2.5e9)) == 3
+        assert model._resolve_freq('2.5ghz') == 3
+    warning.assert_not_called()
+
+
+def test_freq_from_spin_box(model):
+    """A bare number, as the controller passes the spin box value, is in Hz."""
+    with mock.patch.object(network_model.log, 'warning') as warning:
+        assert model._resolve_freq(str(float(2.5e9 + 1))) == 3
+        assert model.mags(str(float(2.4e9)), elevation=0).shape == (3, 1)
+    warning.assert_called_once()
+
+
+def test_freq_off_grid_snaps_with_warning(model):
+    """A frequency between grid points uses the nearest one and says so."""
+    with mock.patch.object(network_model.log, 'warning') as warning:
+        assert model._resolve_freq('2.4ghz') == 3
+    warning.assert_called_once()
+
+
+def test_freq_out_of_range(model):
+    """A frequency more than half a step past the axis is an error."""
+    with pytest.raises(ValueError):
+        model._resolve_freq('5ghz')
+    with pytest.raises(ValueError):
+        model.mags('0.5ghz', elevation=0)
+
+
+def expected_db(azimuth: float, elevation: float) -> np.ndarray:
+    """The dB magnitudes make_ntwk() gives a position, one row per frequency."""
+    return make_ntwk(azimuth, elevation).s_db.reshape(-1, 1)
+
+
+def assert_db(actual: np.ndarray, desired) -> None:
+    """Compare magnitudes at the float32 precision the model stores them in."""
+    np.testing.assert_allclose(actual, desired, rtol=1e-5)
+
+
+def test_out_of_order_appends_stay_sorted():
+    """Rows stay ordered by (elevation, azimuth), each with its own Network."""
+    model = NetworkModel()
+    # Enough points per cut that the cut buffers have to grow along the way
+    points = [(az, el) for az in (30, 10, -10, 20, 0, -20, 40) for el in (5, 0)]
+    for az, el in points:
+        model.append_inplace(make_ntwk(az, el))
+
+    assert [n.params for n in model.ntwk_set] == [
+        {'azimuth': az, 'elevation': el}
+        for az, el in sorted(points, key=lambda p: p[::-1])
+    ]
+    for el in (0, 5):
+        azimuths = model.cut_azimuths(el).ravel()
+        assert azimuths.tolist() == sorted(azimuths)
+        for ntwk, az in zip(model.ntwk_set[model._el_rows(el)], azimuths):
+            assert ntwk.params['azimuth'] == az
+            assert_db(model.mags(azimuth=az, elevation=el), ntwk.s_db.reshape(-1, 1))
+
+
+def test_el_rows(model):
+    """Each elevation cut is one contiguous slice of rows."""
+    assert model._el_rows(0) == slice(0, 3)
+    assert model._el_rows(5) == slice(3, 6)
+    assert model._el_rows(2.5) is None
+
+
+def test_mags_point(model):
+    """Both angles select one network."""
+    assert_db(model.mags(azimuth=10, elevation=5), expected_db(10, 5))
+    assert model.mags('2ghz', azimuth=10, elevation=5).shape == (1, 1)
+    assert model.mags(azimuth=20, elevation=5).size == 0
+
+
+def test_mags_elevation_cut(model):
+    """Elevation alone selects a cut, one row per azimuth."""
+    cut = model.mags('2ghz', elevation=5)
+    assert cut.shape == (3, 1)
+    assert_db(cut.ravel(), [expected_db(az, 5)[2, 0] for az in (-10, 0, 10)])
+    assert_db(model.mags(elevation=5), expected_db(-10, 5))
+    assert model.mags('2ghz', elevation=2.5).size == 0
+
+
+def test_mags_azimuth_cut(model):
+    """Azimuth alone selects one row per elevation."""
+    cut = model.mags('2ghz', azimuth=0)
+    assert cut.shape == (2, 1)
+    assert_db(cut.ravel(), [expected_db(0, el)[2, 0] for el in (0, 5)])
+    assert_db(model.mags(azimuth=0), expected_db(0, 0))
+    assert model.mags(azimuth=20).size == 0
+
+
+def test_mags_no_angles(model):
+    """No angles selects every row, or the first network's trace."""
+    assert model.mags('2ghz').shape == (6, 1)
+    assert_db(model.mags(), expected_db(-10, 0))
+
+
+def test_mags_empty_model():
+    """An empty model has no magnitudes to give."""
+    assert NetworkModel().mags('2ghz', elevation=0).size == 0
+
+
+def test_append_invalidates_cached_axes(model):
+    """Cached azimuths and elevations pick up points appended later."""
+    assert model.azimuths.ravel().tolist() == [-10, 0, 10]
+    assert model.elevations.ravel().tolist() == [0, 5]
+
+    model.append_inplace(make_ntwk(20, 10))
+
+    assert model.azimuths.ravel().tolist() == [-10, 0, 10, 20]
+    assert model.elevations.ravel().tolist() == [0, 5, 10]
+
+
+def test_old_pickle_is_reindexed():
+    """A model pickled before the index existed is rebuilt on load."""
+    old = NetworkModel.__new__(NetworkModel)
+    NetworkSet.__init__(old, [make_ntwk(10, 0), make_ntwk(-10, 0)])
+    assert '_s' not in old.__dict__
+
+    model = cloudpickle.loads(cloudpickle.dumps(old))
+
+    assert model.cut_azimuths(0).ravel().tolist() == [-10, 10]
+    assert_db(
+        model.mags('2ghz', elevation=0).ravel(),
+        [expected_db(-10, 0)[2, 0], expected_db(10, 0)[2, 0]],
+    )
+    model.append_inplace(make_ntwk(0, 0))
+    assert model.cut_azimuths(0).ravel().tolist() == [-10, 0, 10]
+
+
+def test_cut_azimuths_pair_with_mags():
+    """A cut's azimuths line up with its magnitudes when cuts interleave."""
+    # Elevation 5 is measured at azimuths the 0 cut never visits
+    points = [(-10, 0), (-5, 5), (0, 0), (5, 5), (10, 0), (15, 5), (20, 5)]
+    model = NetworkModel([make_ntwk(az, el) for az, el in points])
+
+    for el in (0, 5):
+        azimuths = model.cut_azimuths(el)
+        mags = model.mags('2ghz', elevation=el)
+        assert azimuths.shape == mags.shape
+        assert_db(mags.ravel(), [expected_db(az, el)[2, 0] for az in azimuths.ravel()])
+        np.testing.assert_allclose(model.cut_azimuths_rad(el), np.deg2rad(azimuths))
+
+    assert model.cut_azimuths(0).ravel().tolist() == [-10, 0, 10]
+    assert model.cut_azimuths(2.5).size == 0
+
+
+def test_append_invalidates_cut_azimuths(model):
+    """Cached cut azimuths pick up points appended later."""
+    assert model.cut_azimuths_rad(0).size == 3
+    model.append_inplace(make_ntwk(20, 0))
+    np.testing.assert_allclose(
+        model.cut_azimuths_rad(0).ravel(), np.deg2rad([-10, 0, 10, 20])
+    )
+
+
+@pytest.mark.parametrize(
+    'azimuth, elevation, found',
+    [(10.0004, 4.9996, True), (10.002, 5, False), (10, 4.998, False)],
+)
+def test_lookups_share_one_angle_rule(model, azimuth, elevation, found):
+    """The point, cut and mask lookups agree on what counts as a grid angle."""
+    point = model.mags('2ghz', azimuth=azimuth, elevation=elevation)
+    el_cut = model.mags('2ghz', elevation=elevation)
+    az_cut = model.mags('2ghz', azimuth=azimuth)
+
+    on_el = elevation == 5 or found
+    on_az = azimuth == 10 or found
+    assert point.size == (1 if found else 0)
+    assert el_cut.size == (3 if on_el else 0)
+    assert az_cut.size == (2 if on_az else 0)
+    if found:
+        assert_db(point.ravel(), el_cut[2])
+        assert_db(point.ravel(), az_cut[1])
+
+
+def test_appends_grow_cut_buffers_geometrically():
+    """Appending a cut in scan order reallocates its buffers only log(n) times."""
+    model = NetworkModel([make_ntwk(0, 0)])
+    cut = model._cuts[0]
+    sizes = set()
+    for az in range(1, 200):
+        model.append_inplace(make_ntwk(az, 0))
+        sizes.add(cut._s_db.shape[0])
+
+    assert cut.n == 200
+    assert sorted(sizes) == [2, 4, 8, 16, 32, 64, 128, 256]
+    assert model.cut_azimuths(0).ravel().tolist() == list(range(200))
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 """Tests for `pychamber` package."""
 
+import pathlib
+import re
+
 import pytest
 
 
@@ -19,3 +22,17 @@ def test_content(response):
     # from bs4 import BeautifulSoup
     # assert 'GitHub' in BeautifulSoup(response.content).title.string
     del response
+
+
+def test_new_style_signals():
+    """Signals are connected with signal.connect(slot), never SIGNAL()/SLOT() strings."""
+    old_style = re.compile(r"\b(SIGNAL|SLOT)\(")
+    src = pathlib.Path(__file__).parents[1] / "pychamber"
+    offenders = [
+        f"{path.relative_to(src)}:{lineno}"
+        for path in src.rglob("*.py")
+        if path.name != "resources_rc.py"
+        for lineno, line in enumerate(path.read_text().splitlines(), start=1)
+        if old_style.search(line)
+    ]
+    assert offenders == []